@@ -1,11 +1,219 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+import numpy as np
+from datetime import datetime, timedelta
 import uuid
+import functools
+import gzip
+import csv
+import io
 from data_models import Question, FormTemplate, DataManager
-import json
+import orjson
 from auth import is_authenticated, get_user_templates, get_user_info, show_user_header
 
+_FIELD_TYPES = ('text', 'email', 'phone', 'date', 'number', 'dropdown', 'drop down-single select', 'checkbox', 'radio', 'single select', 'multi select')
+_FIELD_TYPES_INDEX = {field_type: i for i, field_type in enumerate(_FIELD_TYPES)}
+
+_PAGES = ("View Templates", "View Applications", "Upload Excel Template", "Create New Template", "Edit Template", "Manage Questions")
+_PAGE_INDEX = {page: i for i, page in enumerate(_PAGES)}
+_TEMPLATE_GROUPS_PER_PAGE = 10
+
+def _normalize_field_type(field_type):
+    """Map a stored field type (e.g. from Excel) onto one of the editor's _FIELD_TYPES"""
+    if field_type in _FIELD_TYPES_INDEX:
+        return field_type
+    
+    field_type_lower = field_type.lower()
+    if 'drop' in field_type_lower:
+        return 'dropdown'
+    elif 'single' in field_type_lower:
+        return 'single select'
+    elif 'multi' in field_type_lower:
+        return 'multi select'
+    return 'text'
+
+# Joins response options in the editor's text column; commas are common inside
+# option text ("Yes, full-time"), a pipe is not
+_OPTION_SEPARATOR = '|'
+
+_QUESTION_COLUMNS = ['id', 'question_text', 'field_type', 'required', 'field_responses', 'help_text']
+_QUESTION_EDITOR_CONFIG = {
+    'id': None,
+    'question_text': st.column_config.TextColumn("Question Text", required=True),
+    'field_type': st.column_config.SelectboxColumn("Field Type", options=_FIELD_TYPES, default='text', required=True),
+    'required': st.column_config.CheckboxColumn("Required", default=True),
+    'field_responses': st.column_config.TextColumn("Response Options", help="Separated by |, for dropdown/checkbox/radio questions"),
+    'help_text': st.column_config.TextColumn("Help Text"),
+}
+
+def _parse_options(text, separator=','):
+    """Split separated response options, stripping each once and dropping blanks"""
+    return [opt for opt in map(str.strip, text.split(separator)) if opt]
+
+def _questions_frame(rows=()):
+    """Build the question editor DataFrame from question dicts"""
+    df = pd.DataFrame.from_records(list(rows), columns=_QUESTION_COLUMNS)
+    df['field_responses'] = df['field_responses'].map(f' {_OPTION_SEPARATOR} '.join)
+    return df.astype({'required': bool})
+
+def _questions_from_frame(df):
+    """Convert edited question rows back into Question objects, skipping blank rows"""
+    df = df.fillna({'question_text': '', 'field_type': 'text', 'required': True, 'field_responses': '', 'help_text': ''})
+    questions = []
+    for q_data in df.to_dict('records'):
+        if not q_data['question_text'].strip():
+            continue
+        questions.append(Question(
+            id=q_data['id'] if isinstance(q_data['id'], str) else str(uuid.uuid4()),
+            number=len(questions) + 1,
+            question_text=q_data['question_text'],
+            field_type=q_data['field_type'],
+            field_responses=_parse_options(q_data['field_responses'], _OPTION_SEPARATOR),
+            required=bool(q_data['required']),
+            help_text=q_data['help_text']
+        ))
+    return questions
+
+def _dumps_indent(obj) -> bytes:
+    """Pretty-printed JSON bytes for downloads"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+@st.cache_resource
+def get_data_manager():
+    """Shared DataManager instance for all sessions"""
+    return DataManager()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_submitted_applications(_data_manager, org_filter, mtime):
+    """Load submitted applications once per (organization, submissions file mtime)"""
+    applications = _data_manager.get_submitted_applications(org_filter)
+    
+    # Derived display strings and download blobs, computed once per load rather than on every rerun
+    for app in applications:
+        app['_json_bytes'] = _dumps_indent(app)
+        submission_date = app.get('submission_date')
+        app['_submission_date_short'] = submission_date[:10] if submission_date else 'Unknown Date'
+        app['_submission_date_full'] = submission_date[:16] if submission_date else 'N/A'
+        # The filtered position is prepended at render time
+        app['_expander_title'] = f"{app.get('assistance_request_id', 'Unknown ID')} (Submitted: {app['_submission_date_short']})"
+    return applications
+
+@functools.lru_cache(maxsize=None)
+def _org_filter(organization):
+    """Organization name -> key used to match submitted applications"""
+    return organization.lower().replace(" ", "_")
+
+@functools.lru_cache(maxsize=None)
+def _org_slug(organization):
+    """Organization name -> prefix used in export file names"""
+    return organization.replace(' ', '_')
+
+@st.cache_data(show_spinner=False)
+def _all_questions_frame(_data_manager, revision):
+    """Flatten every template's questions into one DataFrame, once per template revision"""
+    records = [
+        (template.name, q.question_text, q.field_type, q.required, q.help_text or 'N/A')
+        for template in _data_manager.get_all_templates().values()
+        for q in template.questions
+    ]
+    return pd.DataFrame.from_records(records, columns=['Template', 'Question', 'Type', 'Required', 'Help Text'])
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _submission_dates(_data_manager, org_filter, mtime):
+    """Parse submission dates once per load into a datetime64 array (NaT when unparseable)"""
+    applications = _load_submitted_applications(_data_manager, org_filter, mtime)
+    return pd.to_datetime(
+        pd.Series([app.get('submission_date', '') for app in applications], dtype=object),
+        format='ISO8601', errors='coerce'
+    ).to_numpy()
+
+@st.cache_data(show_spinner=False)
+def _questions_csv(_data_manager, revision) -> bytes:
+    """CSV export of every template question, once per template revision"""
+    return _all_questions_frame(_data_manager, revision).to_csv(index=False).encode()
+
+def _filter_applications(_data_manager, org_filter, mtime, date_filter):
+    """Keep applications submitted within the selected date range"""
+    applications = _load_submitted_applications(_data_manager, org_filter, mtime)
+    now = datetime.now()
+    if date_filter == "Today":
+        cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif date_filter == "This Week":
+        cutoff = now - timedelta(days=7)
+    elif date_filter == "This Month":
+        cutoff = now - timedelta(days=30)
+    else:
+        # "All Time" and any unrecognized range keep everything
+        return list(applications)
+    
+    mask = _submission_dates(_data_manager, org_filter, mtime) >= np.datetime64(cutoff)
+    return [app for app, keep in zip(applications, mask) if keep]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_apps_json(_data_manager, org_filter, date_filter, mtime) -> bytes:
+    """Build the JSON export once per (organization, date filter, submissions file mtime)
+    
+    Writes the per-application blobs serialized at load time record by record,
+    so the whole list is never serialized again as one object.
+    """
+    buf = io.BytesIO()
+    buf.write(b'[')
+    for i, app in enumerate(_filter_applications(_data_manager, org_filter, mtime, date_filter)):
+        buf.write(b',\n' if i else b'\n')
+        buf.write(app['_json_bytes'])
+    buf.write(b'\n]')
+    return buf.getvalue()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_apps_json_gz(_data_manager, org_filter, date_filter, mtime) -> bytes:
+    """Gzip-compressed copy of the JSON export"""
+    return gzip.compress(_build_apps_json(_data_manager, org_filter, date_filter, mtime), compresslevel=6)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_apps_ndjson(_data_manager, org_filter, date_filter, mtime) -> bytes:
+    """Build the newline-delimited JSON export, one compact record per line"""
+    buf = io.BytesIO()
+    for app in _filter_applications(_data_manager, org_filter, mtime, date_filter):
+        record = {k: v for k, v in app.items() if not k.startswith('_')}
+        buf.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    return buf.getvalue()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_apps_csv(_data_manager, org_filter, date_filter, mtime) -> bytes:
+    """Build the CSV export once per (organization, date filter, submissions file mtime)"""
+    applications = _filter_applications(_data_manager, org_filter, mtime, date_filter)
+    
+    # Custom responses become separate columns, in order of first appearance
+    response_ids = list(dict.fromkeys(
+        question_id for app in applications for question_id in app.get('custom_responses', {})
+    ))
+    
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(['Application_ID', 'Form_ID', 'Submission_Date', 'Description',
+                     'First_Name', 'Last_Name', 'Email', 'Phone',
+                     *(f'Response_{question_id}' for question_id in response_ids)])
+    for app in applications:
+        personal_info = app.get('personal_info', {})
+        custom_responses = app.get('custom_responses', {})
+        writer.writerow([
+            app.get('assistance_request_id', ''),
+            app.get('form_id', ''),
+            app.get('submission_date', ''),
+            app.get('description', ''),
+            personal_info.get('person_first_name', ''),
+            personal_info.get('person_last_name', ''),
+            personal_info.get('person_email_address', ''),
+            personal_info.get('person_phone_number', ''),
+            *(custom_responses.get(question_id, '') for question_id in response_ids)
+        ])
+    
+    return buf.getvalue().encode()
+
+def _on_nav_change():
+    """Sidebar navigation callback: record the chosen page before the rerun"""
+    st.session_state.admin_page = st.session_state._nav_widget
+
 def show_admin_interface():
     """Admin interface for business users to manage forms"""
     st.title("🏢 Business Admin - Form Management")
@@ -50,29 +258,19 @@ def show_admin_interface():
     
     st.markdown("---")
     
-    # Initialize data manager
-    if 'data_manager' not in st.session_state:
-        st.session_state.data_manager = DataManager()
-    
-    data_manager = st.session_state.data_manager
+    data_manager = get_data_manager()
     
     # Sidebar navigation
     st.sidebar.title("Admin Navigation")
     
     # Check if we have a session state page override
-    if hasattr(st.session_state, 'admin_page') and st.session_state.admin_page:
-        default_page = st.session_state.admin_page
-    else:
-        default_page = "View Templates"
+    admin_page = st.session_state.get('admin_page')
+    if admin_page not in _PAGE_INDEX:
+        admin_page = st.session_state.admin_page = "View Templates"
     
-    admin_page = st.sidebar.selectbox(
-        "Choose Action",
-        ["View Templates", "View Applications", "Upload Excel Template", "Create New Template", "Edit Template", "Manage Questions"],
-        index=["View Templates", "View Applications", "Upload Excel Template", "Create New Template", "Edit Template", "Manage Questions"].index(default_page) if default_page in ["View Templates", "View Applications", "Upload Excel Template", "Create New Template", "Edit Template", "Manage Questions"] else 0
-    )
-    
-    # Update session state
-    st.session_state.admin_page = admin_page
+    # Keep the widget in step with programmatic navigation (e.g. "Edit (New Version)")
+    st.session_state._nav_widget = admin_page
+    st.sidebar.selectbox("Choose Action", _PAGES, key="_nav_widget", on_change=_on_nav_change)
     
     if admin_page == "View Templates":
         show_templates_overview(data_manager)
@@ -87,6 +285,74 @@ def show_admin_interface():
     elif admin_page == "Manage Questions":
         manage_questions(data_manager)
 
+def _group_template_versions(template_versions, data_manager):
+    """Group versions by base template in one pass: {base_id: (active_version, versions)}
+    
+    Expects versions sorted newest first (as returned by get_template_versions),
+    so each group comes out already ordered.
+    """
+    groups = {}
+    for template in template_versions:
+        groups.setdefault(template.base_template_id or template.id, []).append(template)
+    
+    return {
+        base_id: (data_manager.get_template_by_id(data_manager.get_active(base_id)) or versions[0], versions)
+        for base_id, versions in groups.items()
+    }
+
+@st.fragment
+def _render_template_group(data_manager, base_id, active_version, versions):
+    """One template group's expander; version selection reruns only this fragment"""
+    with st.expander(f"📄 {active_version.name} (Active: v{active_version.version})", expanded=True):
+        # Show active version details
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.write(f"**Organization:** {active_version.organization}")
+            st.write(f"**Questions:** {len(active_version.questions)}")
+            st.write(f"**Description:** {active_version.description}")
+            st.write(f"**Active Version:** {active_version.version}")
+            st.write(f"**Last Updated:** {active_version.created_at.strftime('%Y-%m-%d %H:%M')}")
+        
+        with col2:
+            # Template actions
+            if st.button(f"Preview Active", key=f"preview_{active_version.id}"):
+                st.session_state.preview_template = active_version.id
+                st.rerun()
+            
+            if st.button(f"Edit (New Version)", key=f"edit_{active_version.id}"):
+                st.session_state.edit_template = active_version.id
+                st.session_state.admin_page = "Edit Template"
+                st.rerun()
+        
+        # Show all versions
+        st.subheader("📊 Version History")
+        
+        versions_df = pd.DataFrame({
+            'Version': [f"v{v.version}" for v in versions],
+            'Status': ["🟢 ACTIVE" if v.is_active else "⚪ Inactive" for v in versions],
+            'Created': [v.created_at.strftime('%Y-%m-%d %H:%M') for v in versions],
+        })
+        selection = st.dataframe(
+            versions_df,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"versions_{base_id}"
+        )
+        
+        selected_rows = selection.selection.rows
+        selected_version = versions[selected_rows[0]] if selected_rows else None
+        if st.button("Activate Selected", key=f"activate_{base_id}",
+                     disabled=selected_version is None or selected_version.is_active):
+            data_manager.set_active_template(selected_version.id)
+            st.success(f"Version {selected_version.version} is now active!")
+            # Activation can change other groups too, so rerun the whole page
+            st.rerun()
+        
+        st.markdown("---")
+
 def show_templates_overview(data_manager):
     """Show overview of form templates accessible to current user with version management"""
     st.header("📋 Your Form Templates")
@@ -103,68 +369,16 @@ def show_templates_overview(data_manager):
     
     st.info(f"Showing templates for: **{user_info['business_name']}**")
     
-    # Group templates by base template
-    template_groups = {}
-    for template in template_versions:
-        base_id = template.base_template_id or template.id
-        if base_id not in template_groups:
-            template_groups[base_id] = []
-        template_groups[base_id].append(template)
-    
-    # Display template groups
-    for base_id, versions in template_groups.items():
-        # Sort versions by version number (newest first)
-        versions.sort(key=lambda x: x.version, reverse=True)
-        active_version = next((v for v in versions if v.is_active), versions[0])
-        
-        with st.expander(f"📄 {active_version.name} (Active: v{active_version.version})", expanded=True):
-            # Show active version details
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.write(f"**Organization:** {active_version.organization}")
-                st.write(f"**Questions:** {len(active_version.questions)}")
-                st.write(f"**Description:** {active_version.description}")
-                st.write(f"**Active Version:** {active_version.version}")
-                st.write(f"**Last Updated:** {active_version.created_at.strftime('%Y-%m-%d %H:%M')}")
-            
-            with col2:
-                # Template actions
-                if st.button(f"Preview Active", key=f"preview_{active_version.id}"):
-                    st.session_state.preview_template = active_version.id
-                    st.rerun()
-                
-                if st.button(f"Edit (New Version)", key=f"edit_{active_version.id}"):
-                    st.session_state.edit_template = active_version.id
-                    st.session_state.admin_page = "Edit Template"
-                    st.rerun()
-            
-            # Show all versions
-            st.subheader("📊 Version History")
-            
-            for version in versions:
-                status = "🟢 ACTIVE" if version.is_active else "⚪ Inactive"
-                created_str = version.created_at.strftime('%Y-%m-%d %H:%M')
-                
-                version_col1, version_col2, version_col3, version_col4 = st.columns([1, 2, 2, 1])
-                
-                with version_col1:
-                    st.write(f"**v{version.version}**")
-                
-                with version_col2:
-                    st.write(f"{status}")
-                
-                with version_col3:
-                    st.write(f"Created: {created_str}")
-                
-                with version_col4:
-                    if not version.is_active:
-                        if st.button(f"Activate", key=f"activate_{version.id}"):
-                            data_manager.set_active_template(version.id)
-                            st.success(f"Version {version.version} is now active!")
-                            st.rerun()
-            
-            st.markdown("---")
+    # Display template groups, a page at a time
+    groups = list(_group_template_versions(template_versions, data_manager).items())
+    page_count = -(-len(groups) // _TEMPLATE_GROUPS_PER_PAGE)
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, key="templates_page")
+    
+    start = (page - 1) * _TEMPLATE_GROUPS_PER_PAGE
+    for base_id, (active_version, versions) in groups[start:start + _TEMPLATE_GROUPS_PER_PAGE]:
+        _render_template_group(data_manager, base_id, active_version, versions)
     
     # Show preview if selected
     if hasattr(st.session_state, 'preview_template') and st.session_state.preview_template:
@@ -178,12 +392,7 @@ def show_templates_overview(data_manager):
 
 def preview_template(data_manager, template_id):
     """Preview a template by ID"""
-    # Find template by ID
-    template = None
-    for tmpl in data_manager.get_all_templates().values():
-        if tmpl.id == template_id:
-            template = tmpl
-            break
+    template = data_manager.get_template_by_id(template_id)
     
     if not template:
         st.error("Template not found!")
@@ -213,6 +422,10 @@ def preview_template(data_manager, template_id):
             if question.conditional_logic:
                 st.write(f"**Conditional Logic:** {question.conditional_logic}")
 
+# Session state behind the create form, cleared after a successful create
+_NEW_TEMPLATE_STATE_KEYS = ("new_template_name", "new_template_organization", "new_template_description",
+                            "new_template_questions", "new_questions_editor")
+
 def create_new_template(data_manager):
     """Create a new form template"""
     st.header("➕ Create New Form Template")
@@ -223,96 +436,40 @@ def create_new_template(data_manager):
     with st.form("new_template_form"):
         st.subheader("Basic Information")
         
-        template_name = st.text_input("Template Name*", placeholder="e.g., Community Health Intake Form")
-        organization = st.text_input("Organization*", value=user_info['business_name'], placeholder="e.g., Community Health Center")
-        description = st.text_area("Description", placeholder="Brief description of this form's purpose")
+        template_name = st.text_input("Template Name*", placeholder="e.g., Community Health Intake Form", key="new_template_name")
+        organization = st.text_input("Organization*", value=user_info['business_name'], placeholder="e.g., Community Health Center", key="new_template_organization")
+        description = st.text_area("Description", placeholder="Brief description of this form's purpose", key="new_template_description")
         
         st.subheader("Questions")
-        st.write("Add questions for your form:")
+        st.write("Add questions for your form (use the table's + / 🗑 controls to add or remove rows):")
         
         # Initialize questions in session state
         if 'new_template_questions' not in st.session_state:
-            st.session_state.new_template_questions = []
+            st.session_state.new_template_questions = _questions_frame()
         
-        # Add question button
-        if st.form_submit_button("Add Question"):
-            st.session_state.new_template_questions.append({
-                'id': str(uuid.uuid4()),
-                'question_text': '',
-                'field_type': 'text',
-                'field_responses': [],
-                'required': True,
-                'help_text': ''
-            })
-            st.rerun()
-        
-        # Display existing questions
-        for i, q in enumerate(st.session_state.new_template_questions):
-            st.write(f"**Question {i+1}**")
-            
-            q['question_text'] = st.text_input(f"Question Text {i+1}", value=q['question_text'], key=f"q_text_{i}")
-            
-            col_a, col_b = st.columns(2)
-            with col_a:
-                field_types = ['text', 'email', 'phone', 'date', 'number', 'dropdown', 'drop down-single select', 'checkbox', 'radio', 'single select', 'multi select']
-                # Handle field type compatibility
-                current_type = q['field_type']
-                if current_type not in field_types:
-                    if 'drop' in current_type.lower():
-                        current_type = 'dropdown'
-                    elif 'single' in current_type.lower():
-                        current_type = 'single select'
-                    elif 'multi' in current_type.lower():
-                        current_type = 'multi select'
-                    else:
-                        current_type = 'text'
-                
-                q['field_type'] = st.selectbox(
-                    f"Field Type {i+1}",
-                    field_types,
-                    index=field_types.index(current_type),
-                    key=f"q_type_{i}"
-                )
-            
-            with col_b:
-                q['required'] = st.checkbox(f"Required {i+1}", value=q['required'], key=f"q_req_{i}")
-            
-            if q['field_type'] in ['dropdown', 'checkbox', 'radio']:
-                responses_text = st.text_area(
-                    f"Response Options {i+1} (one per line)",
-                    value='\n'.join(q['field_responses']),
-                    key=f"q_resp_{i}"
-                )
-                q['field_responses'] = [r.strip() for r in responses_text.split('\n') if r.strip()]
-            
-            q['help_text'] = st.text_input(f"Help Text {i+1}", value=q['help_text'], key=f"q_help_{i}")
-            
-            st.markdown("---")
+        edited_questions = st.data_editor(
+            st.session_state.new_template_questions,
+            column_config=_QUESTION_EDITOR_CONFIG,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="new_questions_editor"
+        )
         
         # Submit template
         submitted = st.form_submit_button("Create Template")
         
         if submitted:
+            # Keep the edited rows so a failed validation doesn't lose them
+            st.session_state.new_template_questions = edited_questions
+            questions = _questions_from_frame(edited_questions)
+            
             if not template_name or not organization:
                 st.error("Please fill in all required fields (marked with *)")
-            elif not st.session_state.new_template_questions:
+            elif not questions:
                 st.error("Please add at least one question to the template")
             else:
-                # Create questions
-                questions = []
-                for i, q_data in enumerate(st.session_state.new_template_questions):
-                    question = Question(
-                        id=q_data['id'],
-                        number=i+1,
-                        question_text=q_data['question_text'],
-                        field_type=q_data['field_type'],
-                        field_responses=q_data['field_responses'],
-                        required=q_data['required'],
-                        help_text=q_data['help_text']
-                    )
-                    questions.append(question)
-                
                 # Create template
+                now = datetime.now()
                 template = FormTemplate(
                     id=str(uuid.uuid4()),
                     name=template_name,
@@ -320,8 +477,8 @@ def create_new_template(data_manager):
                     description=description,
                     questions=questions,
                     standard_fields=[],
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
+                    created_at=now,
+                    updated_at=now,
                     version=1,
                     base_template_id=None,
                     is_active=True
@@ -331,21 +488,10 @@ def create_new_template(data_manager):
                 data_manager.save_template(template)
                 
                 st.success(f"Template '{template_name}' created successfully!")
-                st.session_state.new_template_questions = []
+                # Reset the form only once the template is saved; failed validation keeps the inputs
+                for key in _NEW_TEMPLATE_STATE_KEYS:
+                    st.session_state.pop(key, None)
                 st.rerun()
-    
-    # Question management outside the form
-    if st.session_state.new_template_questions:
-        st.subheader("📝 Manage Questions")
-        st.write("Click to remove questions from your template:")
-        
-        cols = st.columns(3)
-        for i, q in enumerate(st.session_state.new_template_questions):
-            with cols[i % 3]:
-                question_preview = q['question_text'][:30] + "..." if len(q['question_text']) > 30 else q['question_text']
-                if st.button(f"❌ Remove Q{i+1}: {question_preview}", key=f"remove_new_{i}"):
-                    st.session_state.new_template_questions.pop(i)
-                    st.rerun()
 
 def edit_existing_template(data_manager):
     """Edit an existing template"""
@@ -367,21 +513,16 @@ def edit_existing_template(data_manager):
         return
     
     # Template selection
-    template_options = [(f"{t.name} (v{t.version})", t.id) for t in active_templates]
-    template_names = [opt[0] for opt in template_options]
-    template_ids = [opt[1] for opt in template_options]
-    
     # Check if we have a pre-selected template from button click
     default_idx = 0
-    if hasattr(st.session_state, 'edit_template') and st.session_state.edit_template in template_ids:
-        default_idx = template_ids.index(st.session_state.edit_template)
-        # Clear the session state after using it
-        del st.session_state.edit_template
+    edit_template_id = st.session_state.pop('edit_template', None)
+    if edit_template_id is not None:
+        default_idx = next((i for i, t in enumerate(active_templates) if t.id == edit_template_id), 0)
     
-    selected_idx = st.selectbox("Select Template to Edit", range(len(template_names)), 
-                               format_func=lambda x: template_names[x], index=default_idx)
-    selected_template_id = template_ids[selected_idx]
-    template = next(t for t in active_templates if t.id == selected_template_id)
+    selected_idx = st.selectbox("Select Template to Edit", range(len(active_templates)), 
+                               format_func=lambda x: f"{active_templates[x].name} (v{active_templates[x].version})", index=default_idx)
+    template = active_templates[selected_idx]
+    selected_template_id = template.id
     
     st.subheader(f"Editing: {template.name}")
     
@@ -396,104 +537,42 @@ def edit_existing_template(data_manager):
         # Load questions into session state for editing
         session_key = f'edit_questions_{selected_template_id}'
         if session_key not in st.session_state:
-            st.session_state[session_key] = [
+            st.session_state[session_key] = _questions_frame(
                 {
                     'id': q.id,
                     'question_text': q.question_text,
-                    'field_type': q.field_type,
+                    'field_type': _normalize_field_type(q.field_type),
                     'field_responses': q.field_responses,
                     'required': q.required,
                     'help_text': q.help_text or ''
                 }
                 for q in template.questions
-            ]
-        
-        questions_data = st.session_state[session_key]
-        
-        # Add question button
-        if st.form_submit_button("Add Question"):
-            questions_data.append({
-                'id': str(uuid.uuid4()),
-                'question_text': '',
-                'field_type': 'text',
-                'field_responses': [],
-                'required': True,
-                'help_text': ''
-            })
-            st.rerun()
+            )
         
-        # Display and edit questions
-        for i, q in enumerate(questions_data):
-            st.write(f"**Question {i+1}**")
-            
-            q['question_text'] = st.text_input(f"Question Text {i+1}", value=q['question_text'], key=f"edit_q_text_{i}")
-            
-            col_a, col_b = st.columns(2)
-            with col_a:
-                field_types = ['text', 'email', 'phone', 'date', 'number', 'dropdown', 'drop down-single select', 'checkbox', 'radio', 'single select', 'multi select']
-                # Handle field type compatibility
-                current_type = q['field_type']
-                if current_type not in field_types:
-                    if 'drop' in current_type.lower():
-                        current_type = 'dropdown'
-                    elif 'single' in current_type.lower():
-                        current_type = 'single select'
-                    elif 'multi' in current_type.lower():
-                        current_type = 'multi select'
-                    else:
-                        current_type = 'text'
-                
-                q['field_type'] = st.selectbox(
-                    f"Field Type {i+1}",
-                    field_types,
-                    index=field_types.index(current_type),
-                    key=f"edit_q_type_{i}"
-                )
-            
-            with col_b:
-                q['required'] = st.checkbox(f"Required {i+1}", value=q['required'], key=f"edit_q_req_{i}")
-            
-            if q['field_type'] in ['dropdown', 'checkbox', 'radio']:
-                responses_text = st.text_area(
-                    f"Response Options {i+1} (one per line)",
-                    value='\n'.join(q['field_responses']),
-                    key=f"edit_q_resp_{i}"
-                )
-                q['field_responses'] = [r.strip() for r in responses_text.split('\n') if r.strip()]
-            
-            q['help_text'] = st.text_input(f"Help Text {i+1}", value=q['help_text'], key=f"edit_q_help_{i}")
-            
-            st.markdown("---")
+        edited_questions = st.data_editor(
+            st.session_state[session_key],
+            column_config=_QUESTION_EDITOR_CONFIG,
+            num_rows="dynamic",
+            use_container_width=True,
+            key=f"edit_questions_editor_{selected_template_id}"
+        )
         
         # Save changes
         if st.form_submit_button("Save Changes"):
             if not template_name or not organization:
                 st.error("Please fill in all required fields")
             else:
-                # Create new version of template
-                questions = []
-                for i, q_data in enumerate(questions_data):
-                    question = Question(
-                        id=q_data['id'],
-                        number=i+1,
-                        question_text=q_data['question_text'],
-                        field_type=q_data['field_type'],
-                        field_responses=q_data['field_responses'],
-                        required=q_data['required'],
-                        help_text=q_data['help_text']
-                    )
-                    questions.append(question)
-                
                 # Create new template version
+                now = datetime.now()
                 new_template = FormTemplate(
                     id=str(uuid.uuid4()),
                     name=template_name,
                     organization=organization,
                     description=description,
-                    questions=questions,
+                    questions=_questions_from_frame(edited_questions),
                     standard_fields=template.standard_fields,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
+                    created_at=now,
+                    updated_at=now,
                     version=template.version + 1,
                     base_template_id=template.base_template_id or template.id,
                     is_active=True
@@ -503,23 +582,8 @@ def edit_existing_template(data_manager):
                 st.success(f"New template version {new_template.version} created successfully!")
                 
                 # Clear the session state for this template
-                if session_key in st.session_state:
-                    del st.session_state[session_key]
+                del st.session_state[session_key]
                 st.rerun()
-    
-    # Question management outside the form
-    if session_key in st.session_state and st.session_state[session_key]:
-        st.subheader("📝 Manage Questions")
-        st.write("Click to remove questions from your template:")
-        
-        cols = st.columns(3)
-        questions_data = st.session_state[session_key]
-        for i, q in enumerate(questions_data):
-            with cols[i % 3]:
-                question_preview = q['question_text'][:30] + "..." if len(q['question_text']) > 30 else q['question_text']
-                if st.button(f"❌ Remove Q{i+1}: {question_preview}", key=f"remove_edit_{i}"):
-                    questions_data.pop(i)
-                    st.rerun()
 
 def manage_questions(data_manager):
     """Manage questions across templates"""
@@ -533,37 +597,23 @@ def manage_questions(data_manager):
     # Show all questions from all templates
     st.subheader("All Questions Across Templates")
     
-    all_questions = []
-    for template_key, template in templates.items():
-        for question in template.questions:
-            all_questions.append({
-                'Template': template.name,
-                'Question': question.question_text,
-                'Type': question.field_type,
-                'Required': question.required,
-                'Help Text': question.help_text or 'N/A'
-            })
-    
-    if all_questions:
-        df = pd.DataFrame(all_questions)
+    df = _all_questions_frame(data_manager, data_manager.revision)
+    
+    if not df.empty:
         st.dataframe(df, use_container_width=True)
         
         # Export questions
-        if st.button("Export Questions to CSV"):
-            csv = df.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"form_questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
+        st.download_button(
+            label="Export Questions to CSV",
+            data=_questions_csv(data_manager, data_manager.revision),
+            file_name=f"form_questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
     else:
         st.info("No questions found in any template.")
 
 def show_submitted_applications(data_manager):
     """Show submitted applications for the current organization"""
-    from auth import get_user_info
-    
     st.header("📝 Submitted Applications")
     
     # Get current user's organization
@@ -576,8 +626,9 @@ def show_submitted_applications(data_manager):
     st.subheader(f"Applications for: {organization}")
     
     # Get applications for this organization
-    org_filter = organization.lower().replace(" ", "_")
-    applications = data_manager.get_submitted_applications(org_filter)
+    org_filter = _org_filter(organization)
+    submissions_mtime = data_manager.get_submissions_mtime()
+    applications = _load_submitted_applications(data_manager, org_filter, submissions_mtime)
     
     if not applications:
         st.info("No applications have been submitted yet.")
@@ -603,72 +654,54 @@ def show_submitted_applications(data_manager):
         )
     
     # Filter applications based on selections
-    filtered_apps = applications.copy()
-    
-    if date_filter != "All Time":
-        from datetime import datetime, timedelta
-        now = datetime.now()
-        
-        if date_filter == "Today":
-            cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif date_filter == "This Week":
-            cutoff = now - timedelta(days=7)
-        elif date_filter == "This Month":
-            cutoff = now - timedelta(days=30)
-        
-        filtered_apps = [
-            app for app in filtered_apps
-            if datetime.fromisoformat(app.get('submission_date', '')) >= cutoff
-        ]
+    filtered_apps = _filter_applications(data_manager, org_filter, submissions_mtime, date_filter)
     
     # Display each application
     for i, app in enumerate(filtered_apps):
-        with st.expander(
-            f"Application #{i+1} - {app.get('assistance_request_id', 'Unknown ID')} "
-            f"(Submitted: {app.get('submission_date', 'Unknown Date')[:10]})"
-        ):
+        with st.expander(f"Application #{i+1} - {app['_expander_title']}"):
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                st.write("**Application Details:**")
-                st.write(f"• **ID:** {app.get('assistance_request_id', 'N/A')}")
-                st.write(f"• **Form:** {app.get('form_id', 'N/A')}")
-                st.write(f"• **Submitted:** {app.get('submission_date', 'N/A')[:16]}")
-                st.write(f"• **Description:** {app.get('description', 'N/A')}")
+                lines = [
+                    "**Application Details:**",
+                    f"• **ID:** {app.get('assistance_request_id', 'N/A')}",
+                    f"• **Form:** {app.get('form_id', 'N/A')}",
+                    f"• **Submitted:** {app['_submission_date_full']}",
+                    f"• **Description:** {app.get('description', 'N/A')}",
+                ]
                 
                 # Personal Information
                 personal_info = app.get('personal_info', {})
                 if personal_info and any(personal_info.values()):
-                    st.write("**Personal Information:**")
+                    lines.append("**Personal Information:**")
                     if personal_info.get('person_first_name') or personal_info.get('person_last_name'):
                         name = f"{personal_info.get('person_first_name', '')} {personal_info.get('person_last_name', '')}".strip()
-                        st.write(f"• **Name:** {name}")
+                        lines.append(f"• **Name:** {name}")
                     if personal_info.get('person_email_address'):
-                        st.write(f"• **Email:** {personal_info.get('person_email_address')}")
+                        lines.append(f"• **Email:** {personal_info.get('person_email_address')}")
                     if personal_info.get('person_phone_number'):
-                        st.write(f"• **Phone:** {personal_info.get('person_phone_number')}")
+                        lines.append(f"• **Phone:** {personal_info.get('person_phone_number')}")
                 
                 # Custom Responses
                 custom_responses = app.get('custom_responses', {})
                 if custom_responses:
-                    st.write("**Responses:**")
-                    for question_id, response in custom_responses.items():
-                        st.write(f"• **{question_id}:** {response}")
+                    lines.append("**Responses:**")
+                    lines.extend(f"• **{question_id}:** {response}" for question_id, response in custom_responses.items())
+                
+                # One markdown element per application instead of one per line
+                st.markdown("\n\n".join(lines))
             
             with col2:
                 st.write("**Actions:**")
                 
                 # Download individual application
-                if st.button(f"📥 Download JSON", key=f"download_{i}"):
-                    import json
-                    json_str = json.dumps(app, indent=2)
-                    st.download_button(
-                        label="Download Application JSON",
-                        data=json_str,
-                        file_name=f"application_{app.get('assistance_request_id', i)}.json",
-                        mime="application/json",
-                        key=f"download_json_{i}"
-                    )
+                st.download_button(
+                    label="📥 Download JSON",
+                    data=app['_json_bytes'],
+                    file_name=f"application_{app.get('assistance_request_id', i)}.json",
+                    mime="application/json",
+                    key=f"download_json_{i}"
+                )
                 
                 # Mark as processed (future feature)
                 if st.button(f"✅ Mark as Processed", key=f"process_{i}"):
@@ -678,63 +711,43 @@ def show_submitted_applications(data_manager):
     # Bulk download option
     if filtered_apps:
         st.markdown("---")
-        col1, col2 = st.columns([1, 1])
+        col1, col2, col3, col4 = st.columns(4)
+        export_name = f"{_org_slug(organization)}_applications_{datetime.now().strftime('%Y%m%d')}"
         
         with col1:
-            if st.button("📊 Export All to CSV"):
-                # Convert applications to CSV format
-                import pandas as pd
-                
-                csv_data = []
-                for app in filtered_apps:
-                    row = {
-                        'Application_ID': app.get('assistance_request_id', ''),
-                        'Form_ID': app.get('form_id', ''),
-                        'Submission_Date': app.get('submission_date', ''),
-                        'Description': app.get('description', ''),
-                        'First_Name': app.get('personal_info', {}).get('person_first_name', ''),
-                        'Last_Name': app.get('personal_info', {}).get('person_last_name', ''),
-                        'Email': app.get('personal_info', {}).get('person_email_address', ''),
-                        'Phone': app.get('personal_info', {}).get('person_phone_number', ''),
-                    }
-                    
-                    # Add custom responses as separate columns
-                    custom_responses = app.get('custom_responses', {})
-                    for question_id, response in custom_responses.items():
-                        row[f'Response_{question_id}'] = response
-                    
-                    csv_data.append(row)
-                
-                df = pd.DataFrame(csv_data)
-                csv_string = df.to_csv(index=False)
-                
-                st.download_button(
-                    label="Download CSV Report",
-                    data=csv_string,
-                    file_name=f"{organization.replace(' ', '_')}_applications_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
+            st.download_button(
+                label="📊 Export All to CSV",
+                data=_build_apps_csv(data_manager, org_filter, date_filter, submissions_mtime),
+                file_name=f"{export_name}.csv",
+                mime="text/csv"
+            )
         
         with col2:
-            if st.button("📦 Export All to JSON"):
-                import json
-                json_string = json.dumps(filtered_apps, indent=2)
-                
-                st.download_button(
-                    label="Download JSON Report",
-                    data=json_string,
-                    file_name=f"{organization.replace(' ', '_')}_applications_{datetime.now().strftime('%Y%m%d')}.json",
-                    mime="application/json"
-                )
+            st.download_button(
+                label="📦 Export All to JSON",
+                data=_build_apps_json(data_manager, org_filter, date_filter, submissions_mtime),
+                file_name=f"{export_name}.json",
+                mime="application/json"
+            )
+        
+        with col3:
+            st.download_button(
+                label="📦 Export All to NDJSON",
+                data=_build_apps_ndjson(data_manager, org_filter, date_filter, submissions_mtime),
+                file_name=f"{export_name}.ndjson",
+                mime="application/x-ndjson"
+            )
+        
+        with col4:
+            st.download_button(
+                label="🗜️ Export All to JSON.gz",
+                data=_build_apps_json_gz(data_manager, org_filter, date_filter, submissions_mtime),
+                file_name=f"{export_name}.json.gz",
+                mime="application/gzip"
+            )
 
 def upload_excel_template(data_manager):
     """Upload and process Excel files to create new form templates"""
-    from auth import get_user_info
-    import pandas as pd
-    from data_models import Question, FormTemplate
-    import uuid
-    from datetime import datetime
-    
     st.header("📤 Upload Excel Template")
     
     # Get current user's organization
@@ -847,7 +860,7 @@ def upload_excel_template(data_manager):
                             if pd.notna(row.get('Response Options', '')):
                                 options_str = str(row['Response Options']).strip()
                                 if options_str:
-                                    response_options = [opt.strip() for opt in options_str.split(',') if opt.strip()]
+                                    response_options = _parse_options(options_str)
                             
                             # Create question object
                             question = Question(
@@ -870,6 +883,7 @@ def upload_excel_template(data_manager):
                         return
                     
                     # Create form template
+                    now = datetime.now()
                     template = FormTemplate(
                         id=str(uuid.uuid4()),
                         name=template_name.strip(),
@@ -877,8 +891,8 @@ def upload_excel_template(data_manager):
                         description=template_description.strip(),
                         questions=questions,
                         standard_fields=["first_name", "last_name", "email", "phone"],
-                        created_at=datetime.now(),
-                        updated_at=datetime.now()
+                        created_at=now,
+                        updated_at=now
                     )
                     
                     # Save template
@@ -1,8 +1,8 @@
 import streamlit as st
 import os
-from admin_interface import show_admin_interface
+from admin_interface import show_admin_interface, get_data_manager
 from client_interface import show_client_interface
-from auth import show_login_page, is_authenticated, get_interface_type
+from auth import show_login_page, is_authenticated, get_interface_type, get_user_templates, get_user_info
 import config
 
 # Configure Streamlit page
@@ -14,7 +14,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CUSTOM_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -60,7 +60,29 @@ st.markdown("""
         background-color: #f0f2f6;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🤖 Interactive Intake Chatbot System</h1>
+    <p>Streamlined assistance request forms with AI-powered conversation</p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 2rem 0;">
+    <p>🤖 Interactive Intake Chatbot System | Powered by OpenAI GPT-4o Mini & Streamlit</p>
+    <p>Built for streamlined social services intake and assistance request processing</p>
+</div>
+"""
+
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def get_openai_client(api_key):
+    """One pooled OpenAI client per API key, reused across reruns"""
+    import openai
+    return openai.OpenAI(api_key=api_key)
 
 def main():
     """Main application entry point"""
@@ -71,12 +93,7 @@ def main():
         return
     
     # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🤖 Interactive Intake Chatbot System</h1>
-        <p>Streamlined assistance request forms with AI-powered conversation</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Get selected interface from login
     interface_type = get_interface_type()
@@ -105,17 +122,13 @@ def main():
         """)
     
     # Add system status
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### 📊 System Status")
+    st.sidebar.markdown("---\n### 📊 System Status")
     
     # Check if templates are loaded
     try:
-        from data_models import DataManager
-        from auth import get_user_templates, get_user_info
-        dm = DataManager()
-        all_templates = dm.get_all_templates()
+        all_templates = get_data_manager().get_all_templates()
         user_templates = get_user_templates()
-        accessible_templates = {k: v for k, v in all_templates.items() if k in user_templates}
+        accessible_templates = {k: all_templates[k] for k in user_templates if k in all_templates}
         
         user_info = get_user_info()
         st.sidebar.success(f"✅ {len(accessible_templates)} form templates available")
@@ -123,16 +136,14 @@ def main():
         
         # Show accessible template names
         if accessible_templates:
-            st.sidebar.markdown("**Your Forms:**")
-            for key, template in accessible_templates.items():
-                st.sidebar.markdown(f"• {template.name}")
+            lines = ["**Your Forms:**", *(f"• {template.name}" for template in accessible_templates.values())]
+            st.sidebar.markdown("\n\n".join(lines))
     except Exception as e:
         st.sidebar.error(f"❌ Error loading templates: {e}")
     
     # Check OpenAI connection
     try:
-        import openai
-        client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+        client = get_openai_client(config.OPENAI_API_KEY)
         st.sidebar.success("✅ OpenAI connection ready")
     except Exception as e:
         st.sidebar.error(f"❌ OpenAI error: {e}")
@@ -147,12 +158,7 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 2rem 0;">
-        <p>🤖 Interactive Intake Chatbot System | Powered by OpenAI GPT-4o Mini & Streamlit</p>
-        <p>Built for streamlined social services intake and assistance request processing</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
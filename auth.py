@@ -1,6 +1,8 @@
 """
 Authentication system for the Intake Chatbot
 """
+import hashlib
+import hmac
 import streamlit as st
 from typing import Dict, List, Optional
 
@@ -32,45 +34,58 @@ BUSINESS_USERS = {
     }
 }
 
+# Demo accounts listing for the login page, built once at import
+_DEMO_ACCOUNTS_MD = "\n\n".join([
+    "**Available Business Accounts:**",
+    *(f"• **{username}** - {info['display_name']}" for username, info in BUSINESS_USERS.items()),
+    "**Password for all accounts:** `123456`",
+])
+
+def _password_digest(password: str) -> bytes:
+    """Fixed-size digest used to compare passwords in constant time"""
+    return hashlib.blake2b(password.encode(), digest_size=16).digest()
+
+# (password digest, user info) per username, computed once at import
+_CREDS = {username: (_password_digest(info["password"]), info) for username, info in BUSINESS_USERS.items()}
+
 def show_login_page():
     """Display the login page with interface selection"""
     st.title("🔐 Business Portal Login")
     st.markdown("---")
     
-    # Interface selection first
-    st.subheader("🚀 Select Your Interface")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        with st.container():
-            st.markdown("""
-            <div style="border: 2px solid #4CAF50; border-radius: 10px; padding: 20px; text-align: center; margin: 10px;">
-                <h3>👤 Client Portal</h3>
-                <p>Complete intake forms with interactive chatbot assistance</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button("🤖 Login as Client", use_container_width=True, type="primary"):
-                st.session_state.selected_interface = "client"
-                st.rerun()
-    
-    with col2:
-        with st.container():
-            st.markdown("""
-            <div style="border: 2px solid #2196F3; border-radius: 10px; padding: 20px; text-align: center; margin: 10px;">
-                <h3>🏢 Admin Portal</h3>
-                <p>Manage forms, create templates, and configure questions</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button("⚙️ Login as Admin", use_container_width=True):
-                st.session_state.selected_interface = "admin"
-                st.rerun()
-    
-    # Show login form if interface is selected
-    if hasattr(st.session_state, 'selected_interface'):
-        st.markdown("---")
+    # Interface selection first; the cards are only drawn until one is picked
+    if 'selected_interface' not in st.session_state:
+        st.subheader("🚀 Select Your Interface")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            with st.container():
+                st.markdown("""
+                <div style="border: 2px solid #4CAF50; border-radius: 10px; padding: 20px; text-align: center; margin: 10px;">
+                    <h3>👤 Client Portal</h3>
+                    <p>Complete intake forms with interactive chatbot assistance</p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if st.button("🤖 Login as Client", use_container_width=True, type="primary"):
+                    st.session_state.selected_interface = "client"
+                    st.rerun()
+        
+        with col2:
+            with st.container():
+                st.markdown("""
+                <div style="border: 2px solid #2196F3; border-radius: 10px; padding: 20px; text-align: center; margin: 10px;">
+                    <h3>🏢 Admin Portal</h3>
+                    <p>Manage forms, create templates, and configure questions</p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if st.button("⚙️ Login as Admin", use_container_width=True):
+                    st.session_state.selected_interface = "admin"
+                    st.rerun()
+    else:
+        # Show login form for the selected interface
         interface_type = st.session_state.selected_interface
         
         if interface_type == "client":
@@ -90,12 +105,13 @@ def show_login_page():
                 login_button = st.form_submit_button("🚀 Login", use_container_width=True)
             
             if login_button:
-                if authenticate_user(username, password):
+                user_info = _lookup_user(username, password)
+                if user_info is not None:
                     st.session_state.authenticated = True
                     st.session_state.current_user = username
-                    st.session_state.user_info = BUSINESS_USERS[username]
+                    st.session_state.user_info = user_info
                     st.session_state.interface_type = interface_type
-                    st.success(f"Welcome, {BUSINESS_USERS[username]['display_name']}!")
+                    st.success(f"Welcome, {user_info['display_name']}!")
                     st.rerun()
                 else:
                     st.error("❌ Invalid username or password")
@@ -109,16 +125,18 @@ def show_login_page():
     # Show available usernames for demo
     st.markdown("---")
     with st.expander("🔍 Demo Accounts (Click to see available usernames)"):
-        st.markdown("**Available Business Accounts:**")
-        for username, info in BUSINESS_USERS.items():
-            st.markdown(f"• **{username}** - {info['display_name']}")
-        st.markdown("**Password for all accounts:** `123456`")
+        st.markdown(_DEMO_ACCOUNTS_MD)
+
+def _lookup_user(username: str, password: str) -> Optional[Dict]:
+    """Return the user's info if the credentials match, else None"""
+    creds = _CREDS.get(username)
+    if creds is None or not hmac.compare_digest(creds[0], _password_digest(password)):
+        return None
+    return creds[1]
 
 def authenticate_user(username: str, password: str) -> bool:
     """Authenticate a user"""
-    if username in BUSINESS_USERS:
-        return BUSINESS_USERS[username]["password"] == password
-    return False
+    return _lookup_user(username, password) is not None
 
 def is_authenticated() -> bool:
     """Check if user is authenticated"""
@@ -143,22 +161,14 @@ def get_interface_type() -> Optional[str]:
     """Get selected interface type (admin or client)"""
     return st.session_state.get('interface_type')
 
+# Session state cleared on logout
+_SESSION_KEYS = ('authenticated', 'current_user', 'user_info', 'interface_type',
+                 'selected_interface', 'admin_page', 'selected_template')
+
 def logout():
     """Logout current user"""
-    if 'authenticated' in st.session_state:
-        del st.session_state.authenticated
-    if 'current_user' in st.session_state:
-        del st.session_state.current_user
-    if 'user_info' in st.session_state:
-        del st.session_state.user_info
-    if 'interface_type' in st.session_state:
-        del st.session_state.interface_type
-    if 'selected_interface' in st.session_state:
-        del st.session_state.selected_interface
-    if 'admin_page' in st.session_state:
-        del st.session_state.admin_page
-    if 'selected_template' in st.session_state:
-        del st.session_state.selected_template
+    for key in _SESSION_KEYS:
+        st.session_state.pop(key, None)
     st.rerun()
 
 def show_user_header():
@@ -1,23 +1,613 @@
 import openai
-from typing import Dict, List, Optional, Any, Tuple
+import contextlib
+import difflib
+import functools
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import json
 import re
+from dataclasses import dataclass
 from datetime import datetime
 from data_models import Question, FormTemplate, AssistanceRequest, PersonalInfo, AddressInfo
 import config
 
+logger = logging.getLogger(__name__)
+
+# Intent patterns, each fused into one precompiled alternation so a turn runs
+# a single regex search per intent instead of one re.search per pattern
+_HELP_PATTERNS = (
+    r"why.*need.*this",
+    r"why.*ask.*this",
+    r"what.*for",
+    r"help",
+    r"explain",
+    r"don't understand",
+    r"not sure",
+    r"what.*mean",
+    r"what does.*mean",
+    r"what is.*mean",
+    r"what is \w+",  # "what is juvenile"
+    r"what does \w+",  # "what does substance"
+    r".*what does this mean",
+    r".*what is this",
+    r"can you explain",
+    r"can you share",
+    r"tell me about",
+    r"how.*used",
+    r"what.*happen.*with",
+    r"what.*do.*with"
+)
+_HELP_RE = re.compile("|".join(f"(?:{p})" for p in _HELP_PATTERNS))
+
+_AVOIDANCE_PATTERNS = (
+    r"don[''']?t want to answer",
+    r"dotn[''']? want to answer",
+    r"dont want to answer",
+    r"skip this",
+    r"pass",
+    r"next question",
+    r"don[''']?t want to say",
+    r"prefer not to",
+    r"rather not",
+    r"none of your business",
+    r"private",
+    r"can[''']?t answer"
+)
+_AVOIDANCE_RE = re.compile("|".join(f"(?:{p})" for p in _AVOIDANCE_PATTERNS))
+
+_CONFUSION_PATTERNS = (
+    r"i don[''']?t get it",
+    r"don[''']?t understand",
+    r"why.*question",
+    r"why.*ask",
+    r"confused",
+    r"what does this mean",
+    r"i don[''']?t know why",
+    r"not sure why",
+    r"why do you need",
+    r"what[''']?s the point"
+)
+_CONFUSION_RE = re.compile("|".join(f"(?:{p})" for p in _CONFUSION_PATTERNS))
+
+# Help and confusion lead to the same reply, so process_answer scans for both at once
+_EXPLAIN_RE = re.compile(f"{_HELP_RE.pattern}|{_CONFUSION_RE.pattern}")
+
+# Literal fragments at least one of which every help/avoidance/confusion pattern
+# requires; a reply containing none of them cannot match, so plain answers skip
+# the regex scans. Keep in step with the pattern tuples above
+_INTENT_TRIGGERS = (
+    "why", "what", "how", "help", "explain", "understand", "sure", "can you", "tell me",
+    "want to", "skip", "pass", "next question", "prefer not to", "rather not", "business",
+    "private", "t answer", "t get it", "confused", "point"
+)
+
+# Conditional logic forms: "If Q1 = 'Yes', show this question" / "Skip if Q2 != 'Married'"
+_COND_SHOW_RE = re.compile(r'if\s+q?(\d+)\s*=\s*[\'"]?([^\'"]+)[\'"]?')
+_COND_SKIP_RE = re.compile(r'skip\s+if\s+q?(\d+)\s*!=\s*[\'"]?([^\'"]+)[\'"]?')
+
+def _parse_cond(conditional_logic: str) -> Optional[Tuple[str, int, str]]:
+    """Parse conditional logic into (op, question number, expected lowercase value)"""
+    logic = conditional_logic.lower().strip()
+    for op, pattern in (("show", _COND_SHOW_RE), ("skip", _COND_SKIP_RE)):
+        match = pattern.search(logic)
+        if match:
+            return op, int(match.group(1)), match.group(2).strip().lower()
+    return None
+
+# Canned explanations by question keyword, used when GPT is unavailable
+_FALLBACK_EXPLANATIONS = {
+    "drug": "I understand this feels personal. We ask about substance use so we can connect you with the right support services if needed. This information is confidential and helps us provide better care.",
+    "substance abuse": "History of substance abuse means past or current problems with drugs or alcohol that have affected your life, work, relationships, or health. We ask this to understand what support services might be helpful for you.",
+    "substance": "This helps us understand what kind of support might be helpful. All information is kept private and only used to connect you with appropriate resources.",
+    "history": "Family history helps us understand potential risk factors and provide better support. This information is confidential and helps our team serve you better.",
+    "court": "Legal information helps us understand any constraints or needs you might have. This ensures we provide appropriate services and support.",
+    "find out": "We ask how you heard about us to understand which outreach methods work best and to improve our services. This helps us serve the community better.",
+    "services": "Understanding how you found us helps us improve our outreach and ensures we're reaching people who need our help most effectively.",
+    "referred": "We ask about referrals to understand what services you've already tried and coordinate your care better.",
+    "treatment": "We ask about treatment to understand your care history and avoid duplication of services.",
+    "resources": "We want to know what resources you've been offered so we can build on existing support and avoid gaps in care.",
+    "juvenile": "Juvenile means under 18 years old. We ask this because different services and legal protections apply to minors versus adults.",
+    "adult": "Adult means 18 years old or older. This determines which services and legal frameworks apply to your situation."
+}
+
+# Overlapping scan for every fallback key; alternatives are listed in priority
+# order so the earliest key in the dict wins, as with the old sequential checks
+_FALLBACK_PRIORITY = {key: i for i, key in enumerate(_FALLBACK_EXPLANATIONS)}
+_FALLBACK_RE = re.compile("(?=(" + "|".join(map(re.escape, _FALLBACK_EXPLANATIONS)) + "))")
+
+# Program bits for the program-specific skip rule (MOMS questions are never skipped)
+_PROGRAM_BITS = (("dads", 1), ("epic", 2), ("mend", 4))
+
+def _program_mask(text: str) -> int:
+    """Bitmask of the DADS/EPIC/MEND programs mentioned in lowercase text"""
+    mask = 0
+    for name, bit in _PROGRAM_BITS:
+        if name in text:
+            mask |= bit
+    return mask
+
+# Informal yes/no replies accepted when an option contains "yes" / "no"
+_YES_TOKENS = frozenset({'y', 'yes', 'yep', 'yeah'})
+_NO_TOKENS = frozenset({'n', 'no', 'nope', 'nah'})
+_YES_NO_TOKENS = _YES_TOKENS | _NO_TOKENS
+
+# Standard personal/address field filled by a question, by keywords in its text;
+# the first matching rule wins
+_STANDARD_FIELD_RULES = (
+    (lambda text: 'first name' in text, ("personal_info", "person_first_name")),
+    (lambda text: 'last name' in text, ("personal_info", "person_last_name")),
+    (lambda text: 'email' in text, ("personal_info", "person_email_address")),
+    (lambda text: 'phone' in text, ("personal_info", "person_phone_number")),
+    (lambda text: 'birth' in text or 'age' in text, ("personal_info", "person_date_of_birth")),
+    (lambda text: 'gender' in text, ("personal_info", "person_gender")),
+    (lambda text: 'race' in text, ("personal_info", "person_race")),
+    (lambda text: 'ethnicity' in text, ("personal_info", "person_ethnicity")),
+    (lambda text: 'marital' in text, ("personal_info", "person_marital_status")),
+    (lambda text: 'address' in text and 'line 1' in text, ("address_info", "address_line_1")),
+    (lambda text: 'city' in text, ("address_info", "address_city")),
+    (lambda text: 'state' in text, ("address_info", "address_state")),
+    (lambda text: 'zip' in text or 'postal' in text, ("address_info", "address_postal_code")),
+)
+
+def _standard_field_for(text: str) -> Optional[Tuple[str, str]]:
+    """(section, field) of the standard field a lowercase question text maps to"""
+    for matches, target in _STANDARD_FIELD_RULES:
+        if matches(text):
+            return target
+    return None
+
+# Contact fields listed under personal information in the summary
+_SUMMARY_CONTACT_FIELDS = (
+    ("Email", "person_email_address"),
+    ("Phone", "person_phone_number"),
+)
+
+_CATEGORICAL_TYPES = frozenset({'dropdown', 'drop down-single select', 'radio', 'single select'})
+_MULTI_SELECT_TYPES = frozenset({'checkbox', 'multi select'})
+
+# Messages used in turn when a user avoids a question; {q} is the question text
+_PERSUADE = (
+    "I understand this question might feel personal. However, answering '{q}' helps us provide you with the most appropriate support and resources. Your information is completely confidential and only used to help you better.",
+    "I know some questions can be uncomfortable, but '{q}' is important for connecting you with the right services. All your responses are kept private and secure. Would you be willing to share this information?",
+    "This question might seem intrusive, but '{q}' helps our team understand your needs better. Everything you share is confidential and helps us serve you more effectively. Could you help us by answering?"
+)
+
+# Confirmation messages after a valid answer; {answer} is the user's reply
+_CONFIRMATIONS = (
+    "Got it! I've recorded your answer: {answer}",
+    "Thank you! I've noted: {answer}",
+    "Perfect! I've saved: {answer}",
+    "Excellent! I've recorded: {answer}"
+)
+
+# GPT verdicts for free-text answers keyed by (question id, normalized answer),
+# shared across sessions and trimmed least-recently-used first
+_VALIDATION_CACHE_SIZE = 4096
+_VALIDATION_CACHE: "OrderedDict[Tuple[str, str], Tuple[bool, Optional[str]]]" = OrderedDict()
+_VALIDATION_LOCK = threading.Lock()
+
+# Validations currently waiting on GPT, so identical answers submitted by
+# concurrent sessions share one call instead of each making their own
+_VALIDATION_INFLIGHT: Dict[Tuple[str, str], Future] = {}
+
+# Near-duplicate tier: recent cached answers per question, reused when a new
+# answer is at least this similar (difflib ratio). Short answers are exact-only,
+# where a one-letter change can flip the meaning
+_VALIDATION_RECENT: Dict[str, "deque[str]"] = {}
+_VALIDATION_RECENT_SIZE = 32
+_VALIDATION_SIMILARITY = 0.92
+_VALIDATION_FUZZY_MIN_LEN = 12
+
+def _recent_verdicts(question_id: str) -> List[Tuple[str, bool]]:
+    """(answer, is_valid) for the question's recent cached answers, newest first; call under _VALIDATION_LOCK"""
+    recent = []
+    for candidate in reversed(_VALIDATION_RECENT.get(question_id, ())):
+        verdict = _VALIDATION_CACHE.get((question_id, candidate))
+        if verdict is not None:
+            recent.append((candidate, verdict[0]))
+    return recent
+
+def _similar_cached_verdict(normalized: str, recent: List[Tuple[str, bool]]) -> Optional[bool]:
+    """Validity cached for a recent answer that nearly matches this one
+
+    Only the boolean is reused; the cached reason was written for the other answer
+    """
+    if len(normalized) < _VALIDATION_FUZZY_MIN_LEN:
+        return None
+    for candidate, is_valid in recent:
+        matcher = difflib.SequenceMatcher(None, normalized, candidate)
+        if matcher.real_quick_ratio() >= _VALIDATION_SIMILARITY and matcher.quick_ratio() >= _VALIDATION_SIMILARITY \
+                and matcher.ratio() >= _VALIDATION_SIMILARITY:
+            return is_valid
+    return None
+
+# Replies that ask about the question itself ("why do you need this", "how is this used");
+# a bare "what ..." or "how ..." opening is often a real answer ("what happened is ...")
+_META_QUESTION_RE = re.compile(
+    r"(?:why (?:do|would|does|is|are) (?:you|it|this|that)|why (?:ask|should i)"
+    r"|what (?:is|s) (?:this|that|it) (?:for|about)|what (?:is|s) the point|what do you mean"
+    r"|what (?:is|s|does) \w+(?: mean)?$"
+    r"|how (?:is|will|would) (?:this|that|it|my \w+) (?:be )?used"
+    r"|can you (?:explain|clarify|tell me why)|do you need (?:this|that|to know))\b"
+)
+# Openings that make a reply ending in '?' a question back to us; a short hedged
+# answer such as "Nurse?" or "Around $2000?" still goes to validation
+_QUESTION_OPENER_RE = re.compile(
+    r"(?:why|how|what|who|when|where|which|can you|could you|do you|does|did you|should|would you|will you)\b"
+)
+# Question openings whose natural answer is a plain yes or no
+_YES_NO_QUESTION_STARTS = ("do ", "does ", "did ", "are ", "is ", "was ", "have ", "has ", "will ", "would ", "can ")
+
+# Fixed instructions go in the system message and only the question/answer in
+# the user message, so every call shares the same prompt prefix
+_VALIDATOR_SYSTEM_PROMPT = """You are a social services intake form validator. Be helpful but concise.
+
+You are validating a user's response to a social services intake form question.
+
+Analyze the user's response and determine:
+1. Is this a QUESTION back to you? (like "how is this used?", "why do you need this?")
+2. Is this an ANSWER that's relevant to the question asked?
+3. Is this an ANSWER but completely unrelated/off-topic?
+
+Rules:
+- If it's a QUESTION, mark as invalid and explain why the info is needed
+- If it's an ANSWER but irrelevant, mark as invalid and provide a good example
+- If it's a relevant ANSWER, mark as valid
+- Leave reason and example empty for valid answers; keep them brief and realistic otherwise"""
+
+# Structured output for the validator: the verdict comes back as schema-checked JSON,
+# with "valid" first so a streamed true verdict can end the call early
+_VALIDATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "validation",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "valid": {"type": "boolean"},
+                "type": {"type": "string", "enum": ["question", "answer", "off-topic"]},
+                "reason": {"type": "string"},
+                "example": {"type": "string"}
+            },
+            "required": ["valid", "type", "reason", "example"],
+            "additionalProperties": False
+        }
+    }
+}
+_VALID_HEAD_RE = re.compile(r'\s*\{\s*"valid"\s*:\s*(true|false)')
+
+_FAQ_SYSTEM_PROMPT = """You are a helpful assistant for an intake form system, explaining why intake form information is collected. A user is asking about why certain information is needed in an intake form.
+
+Provide a brief, friendly explanation (2-3 sentences) about why this information might be needed for social services, healthcare, or community assistance programs. Focus on how it helps connect them with appropriate resources and services."""
+
+# FAQ answers keyed by normalized question text, shared across sessions (LRU)
+_FAQ_CACHE_SIZE = 512
+_FAQ_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_FAQ_LOCK = threading.Lock()
+
+# Answer validators for typed fields
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'[\d\s\-\(\)]{10,}')
+_DATE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|[A-Za-z]+ \d{1,2},? \d{4}')
+_NUMBER_RE = re.compile(r'\d')
+
+# Format hints by field type keyword; the first match wins
+_FORMAT_HINTS = {
+    'email': "💌 Please provide a valid email address (like john@example.com)",
+    'phone': "📞 Please provide your phone number (like 555-123-4567)",
+    'date': "📅 Please provide the date (like MM/DD/YYYY or January 1, 1990)",
+    'number': "🔢 Please provide a number",
+    'free text box': "💬 Please type your answer",
+    'text': "💬 Please type your answer"
+}
+
+def _render_prompt_suffix(question: Question, field_type: str, is_categorical: bool, is_multi_select: bool) -> str:
+    """Response options and format hint appended to a question when it is asked"""
+    suffix = ""
+    
+    # Add response options for multiple choice questions in a conversational way
+    if question.field_responses and len(question.field_responses) > 0:
+        if is_categorical:
+            if len(question.field_responses) <= 2:
+                # For 2 options, show with "or"
+                options = " or ".join([f"**{opt}**" for opt in question.field_responses])
+                suffix += f"\n\nYou can answer: {options}"
+            elif len(question.field_responses) <= 4:
+                # For 3-4 options, show with commas and "or"
+                if len(question.field_responses) == 3:
+                    options = f"**{question.field_responses[0]}**, **{question.field_responses[1]}**, or **{question.field_responses[2]}**"
+                else:  # 4 options
+                    options = f"**{question.field_responses[0]}**, **{question.field_responses[1]}**, **{question.field_responses[2]}**, or **{question.field_responses[3]}**"
+                suffix += f"\n\nYou can choose: {options}"
+            else:
+                # For 5+ options, use a clean numbered list
+                options_list = "\n".join([f"{i+1}. **{opt}**" for i, opt in enumerate(question.field_responses)])
+                suffix += f"\n\nPlease choose from these options:\n{options_list}"
+                
+        elif is_multi_select:
+            if len(question.field_responses) <= 3:
+                # For short lists, show inline with commas
+                options = ", ".join([f"**{opt}**" for opt in question.field_responses])
+                suffix += f"\n\nYou can select: {options} (choose one or more)"
+            else:
+                # For longer lists, use numbered format
+                options_list = "\n".join([f"{i+1}. **{opt}**" for i, opt in enumerate(question.field_responses)])
+                suffix += f"\n\nYou can select multiple options from:\n{options_list}"
+    
+    # Add format hints for specific field types
+    for hint_key, hint_text in _FORMAT_HINTS.items():
+        if hint_key in field_type:
+            suffix += f"\n\n{hint_text}"
+            break
+    
+    return suffix
+
+@dataclass(frozen=True, slots=True)
+class _QuestionInfo:
+    """Lowercased question fields, normalized once per template"""
+    field_type: str
+    text: str
+    is_categorical: bool
+    is_multi_select: bool
+    options: Tuple[str, ...]
+    prompt_suffix: str
+    program_mask: int
+    exact_options: frozenset
+    option_re: Optional[re.Pattern]
+    stripped_options: Tuple[str, ...]
+    option_set: frozenset
+    accepts_yes: bool
+    accepts_no: bool
+    is_yes_no: bool
+    standard_field: Optional[Tuple[str, str]]
+    options_text: str
+    choice_error: str
+    select_error: str
+    yes_no_error: str
+
+def _question_info(question: Question) -> _QuestionInfo:
+    """Normalize a question's text, type and options for matching"""
+    field_type = question.field_type.lower()
+    text = question.question_text.lower()
+    is_categorical = field_type in _CATEGORICAL_TYPES
+    is_multi_select = field_type in _MULTI_SELECT_TYPES
+    options = tuple(opt.casefold() for opt in question.field_responses or ())
+    stripped_options = tuple(opt.strip() for opt in options)
+    option_set = frozenset(stripped_options)
+    
+    # Exact option matches are accepted up front, but only for categorical questions
+    # that _validate_answer would not first route to the phone/date/number checks
+    exact_options = frozenset()
+    if is_categorical and not ('phone' in text or 'birth' in text or '$' in question.question_text):
+        exact_options = option_set
+    
+    # Option listings and the invalid-choice messages built from them
+    options_text = " • ".join(question.field_responses or ())
+    is_yes_no = len(options) == 2 and all(opt in ('yes', 'no') for opt in options)
+    yes_no_error = ""
+    if is_yes_no:
+        yes_no_error = f"This question needs a simple Yes or No answer. Please choose: {' or '.join(question.field_responses)}"
+    
+    return _QuestionInfo(
+        field_type=field_type,
+        text=text,
+        is_categorical=is_categorical,
+        is_multi_select=is_multi_select,
+        options=options,
+        prompt_suffix=_render_prompt_suffix(question, field_type, is_categorical, is_multi_select),
+        program_mask=_program_mask(text) if "program" in text else 0,
+        exact_options=exact_options,
+        # One scan finds whether any option appears in an answer
+        option_re=re.compile("|".join(map(re.escape, options))) if options else None,
+        stripped_options=stripped_options,
+        option_set=option_set,
+        accepts_yes=any('yes' in opt for opt in options),
+        accepts_no=any('no' in opt for opt in options),
+        is_yes_no=is_yes_no,
+        standard_field=_standard_field_for(text),
+        options_text=options_text,
+        choice_error=f"Please choose one of these options: {options_text}",
+        select_error=f"Please select from these options: {options_text}",
+        yes_no_error=yes_no_error
+    )
+
+# Question-text keywords that mark the earlier answers the smart skip rules look at
+_SKIP_RULE_TAGS = (
+    ("court_case", lambda text: "court case" in text),
+    ("marital", lambda text: "married" in text or "marital" in text),
+    ("program_enrollment", lambda text: "program" in text and "enrolled" in text),
+    ("benefits", lambda text: "benefit" in text),
+)
+
+# Exact question texts with hand-written conversational versions
+_CONV_MAP = {
+    "Does individual have a court case?": "Do you currently have any ongoing court cases?",
+    "Referral source to Court:": "How did you find out about our court services?",
+    "City / Ciudad": "What city do you live in?",
+    "What is your monthly TANF benefit?": "Do you receive TANF benefits? If yes, what's your monthly amount?",
+    "Are you currently participating in any Y programs?": "Are you currently participating in any YMCA programs?",
+    "Program Currently Enrolled": "Which program are you currently enrolled in or interested in?",
+    "Secondary Contact Information to reach you (Phone Number)": "Is there another phone number we can reach you at?",
+    "Secondary Contact Information to reach you (Email)": "Do you have an alternate email address?",
+    "Preferred Method of contact (Select all that apply)": "How would you prefer us to contact you?",
+    "Preferred Language": "What language would you prefer for our communications?",
+    "Other phone or email": "Do you have any other contact information you'd like to share?",
+    "Pronouns (optional)": "What pronouns do you use? (This is optional)",
+    "Is the individual a Broomfield resident?": "Are you a Broomfield resident?",
+    "Does the individual have a history of substance abuse?": "Do you have a history of substance abuse?",
+    "What is the individual's drug of choice?": "What is your primary substance of concern?",
+    "Does the individual have a family history of substance abuse?": "Does your family have a history of substance abuse?"
+}
+
+# Third-person phrasings rewritten to second person, applied in order
+_CONVERSATIONAL_SUBS = tuple((re.compile(pattern, re.IGNORECASE), repl) for pattern, repl in (
+    (r'\bthe individual\b', 'you'),
+    (r'\bindividual\b', 'you'),
+    (r'\bDoes you\b', 'Do you'),
+    (r'\bIs you\b', 'Are you'),
+    (r'\bHas you\b', 'Do you have'),
+))
+
+# GPT explanations keyed by (question id, intent bucket); shared across sessions
+# since many users ask the same question the same way. Term buckets come from user
+# input, so the cache is trimmed least-recently-used first
+_EXPLANATION_CACHE_SIZE = 2048
+_EXPLANATION_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_EXPLANATION_LOCK = threading.Lock()
+
+# Question ids whose prewarm is running or done, so concurrent sessions on the same
+# template start each background call once per process (guarded by _EXPLANATION_LOCK)
+_PREWARM_CLAIMED: set = set()
+
+def _claim_prewarm(question_id: str) -> bool:
+    """Whether this caller should prewarm the question's explanation"""
+    with _EXPLANATION_LOCK:
+        if question_id in _PREWARM_CLAIMED:
+            return False
+        _PREWARM_CLAIMED.add(question_id)
+        return True
+
+def _cached_explanation(cache_key: Tuple[str, str]) -> Optional[str]:
+    """Cached explanation for (question id, intent bucket), if any"""
+    with _EXPLANATION_LOCK:
+        explanation = _EXPLANATION_CACHE.get(cache_key)
+        if explanation is not None:
+            _EXPLANATION_CACHE.move_to_end(cache_key)
+        return explanation
+
+def _store_explanation(cache_key: Tuple[str, str], explanation: str, replace: bool = True):
+    """Cache an explanation, keeping an existing one unless replace is set"""
+    with _EXPLANATION_LOCK:
+        if replace or cache_key not in _EXPLANATION_CACHE:
+            _EXPLANATION_CACHE[cache_key] = explanation
+        _EXPLANATION_CACHE.move_to_end(cache_key)
+        if len(_EXPLANATION_CACHE) > _EXPLANATION_CACHE_SIZE:
+            _EXPLANATION_CACHE.popitem(last=False)
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+def _normalize_text(text: str) -> str:
+    """Lowercase text and collapse punctuation and whitespace, for cache keys"""
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+_TERM_QUERY_RE = re.compile(r"\bwhat (?:is|does) (\w+)")
+
+def _explanation_intent(user_input: str) -> str:
+    """Bucket a help request so equivalent phrasings share one cached explanation"""
+    text = _normalize_text(user_input)
+    match = _TERM_QUERY_RE.search(text)
+    if match and match.group(1) not in ("this", "that", "it"):
+        return f"term:{match.group(1)}"
+    if "why" in text or "what for" in text or "point" in text:
+        return "why"
+    if "mean" in text or "what is" in text or "what does" in text:
+        return "meaning"
+    return "general"
+
+# Caps concurrent OpenAI calls across sessions (OAI_CONCURRENCY); background
+# pre-generation runs on a shared pool of at most half as many workers, so
+# user-facing calls always get a slot and a long template queues rather than
+# starting a thread per question.
+# Each request's 429s are retried with backoff by the openai client itself
+_OPENAI_CONCURRENCY = max(1, int(os.getenv("OAI_CONCURRENCY", "8")))
+_OPENAI_SLOTS = threading.BoundedSemaphore(_OPENAI_CONCURRENCY)
+_PREWARM_POOL = ThreadPoolExecutor(max_workers=max(1, _OPENAI_CONCURRENCY // 2), thread_name_prefix="prewarm")
+
+# Monotonic time before which new calls hold off after a 429 that outlasted the client's retries
+_rate_limited_until = 0.0
+_RATE_LIMIT_LOCK = threading.Lock()
+
+@contextlib.contextmanager
+def _openai_slot():
+    """Hold a shared OpenAI call slot, waiting out any rate-limit pause before taking it"""
+    global _rate_limited_until
+    with _RATE_LIMIT_LOCK:
+        pause = _rate_limited_until - time.monotonic()
+    # Sleeping without a slot leaves it free for calls that are not held off
+    if pause > 0:
+        time.sleep(pause)
+    with _OPENAI_SLOTS:
+        try:
+            yield
+        except openai.RateLimitError as e:
+            try:
+                retry_after = float(e.response.headers.get("retry-after", 1))
+            except (AttributeError, TypeError, ValueError):
+                retry_after = 1.0
+            with _RATE_LIMIT_LOCK:
+                _rate_limited_until = max(_rate_limited_until, time.monotonic() + min(retry_after, 30))
+            raise
+
+# Phrasing used to pre-generate explanations; it lands in the "why" bucket
+_PREWARM_QUESTION = "Why do you need this?"
+
+def _explanation_messages(question_text: str, user_input: str, as_json: bool = False) -> List[Dict[str, str]]:
+    """Chat messages asking GPT to explain why a question is asked"""
+    prompt = f"""
+    You are a helpful assistant for a social services intake form. A user is confused about this question: "{question_text}"
+    
+    The user said: "{user_input}"
+    
+    Please provide a brief, empathetic explanation (2-3 sentences) about:
+    1. Why this information is needed for social services
+    2. How it helps connect them with appropriate resources
+    3. Reassure them about privacy/confidentiality if relevant
+    
+    Be conversational, friendly, and understanding. Don't repeat the question.
+    """
+    system = "You are a compassionate social services intake assistant."
+    if as_json:
+        system += " Return JSON with a single key 'explanation'."
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt}
+    ]
+
+# Output cap for explanations: 2-3 sentences fit well under it, and a lower
+# ceiling bounds generation time when the model runs long
+_EXPLANATION_MAX_TOKENS = 90
+
+@functools.lru_cache(maxsize=None)
+def _shared_client(api_key: Optional[str]) -> openai.OpenAI:
+    """One OpenAI client per API key, so every engine reuses its pooled connections"""
+    return openai.OpenAI(api_key=api_key, timeout=30)
+
 class ChatbotEngine:
     """AI-powered chatbot for interactive form filling"""
     
+    __slots__ = ("client", "conversation_history", "current_question", "current_template", "responses",
+                 "personal_info", "address_info", "_responses_lower", "_answers_by_number",
+                 "_answer_counts", "_enrolled_masks", "_tag_index", "_parsed_cond", "_fmt_cache", "_qinfo",
+                 "_summary_header", "_summary_lines", "_persuade_idx")
+    
     def __init__(self):
         openai.api_key = config.OPENAI_API_KEY
-        self.client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = _shared_client(config.OPENAI_API_KEY)
         self.conversation_history = []
         self.current_question = None
         self.current_template = None
         self.responses = {}
         self.personal_info = PersonalInfo()
         self.address_info = AddressInfo()
+        self._responses_lower = {}
+        self._answers_by_number = {}
+        self._answer_counts = Counter()
+        self._enrolled_masks = {}
+        self._tag_index = {}
+        self._parsed_cond = {}
+        self._fmt_cache = {}
+        self._qinfo = {}
+        self._summary_header = ""
+        self._summary_lines = {}
+        self._persuade_idx = 0
     
     def start_conversation(self, template: FormTemplate) -> str:
         """Start a new conversation with a form template"""
@@ -27,6 +617,29 @@ class ChatbotEngine:
         self.personal_info = PersonalInfo()
         self.address_info = AddressInfo()
         
+        # Index questions and parse conditional logic once per template
+        self._responses_lower = {}
+        self._answers_by_number = {}
+        self._answer_counts = Counter()
+        self._enrolled_masks = {}
+        self._tag_index = {tag: [] for tag, _ in _SKIP_RULE_TAGS}
+        self._parsed_cond = {}
+        self._fmt_cache = {}
+        self._qinfo = {}
+        # Summary text that depends only on the template, rendered once
+        self._summary_header = f"## Summary of {template.name}\n\n"
+        self._summary_lines = {}
+        for q in template.questions:
+            self._summary_lines.setdefault(q.id, f"• {q.question_text}: ")
+            info = self._qinfo[q.id] = _question_info(q)
+            for tag, matches in _SKIP_RULE_TAGS:
+                if matches(info.text):
+                    self._tag_index[tag].append(q.id)
+            if q.conditional_logic:
+                self._parsed_cond[q.id] = _parse_cond(q.conditional_logic)
+        
+        self._prewarm_explanations(template.questions)
+        
         welcome_message = f"""
         Hello! I'm here to help you complete the {template.name} intake form. 
         
@@ -38,6 +651,41 @@ class ChatbotEngine:
         
         return welcome_message.strip()
     
+    def _info(self, question: Question) -> _QuestionInfo:
+        """Normalized fields for a question, computed on first use"""
+        info = self._qinfo.get(question.id)
+        if info is None:
+            info = self._qinfo[question.id] = _question_info(question)
+        return info
+    
+    def _prewarm_explanations(self, questions: List[Question]):
+        """Generate "why" explanations for the template in the background"""
+        prewarm_key = _explanation_intent(_PREWARM_QUESTION)
+        for question in questions:
+            if _cached_explanation((question.id, prewarm_key)) is None and _claim_prewarm(question.id):
+                _PREWARM_POOL.submit(self._prewarm_explanation, question, prewarm_key)
+    
+    def _prewarm_explanation(self, question: Question, prewarm_key: str):
+        """Fetch and cache one question's explanation; failures are left to the on-demand path"""
+        try:
+            with _openai_slot():
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=_explanation_messages(question.question_text, _PREWARM_QUESTION, as_json=True),
+                    max_tokens=_EXPLANATION_MAX_TOKENS,
+                    temperature=0.4,
+                    response_format={"type": "json_object"}
+                )
+            explanation = str(json.loads(response.choices[0].message.content)["explanation"]).strip()
+            if explanation:
+                _store_explanation((question.id, prewarm_key), explanation, replace=False)
+                return
+        except Exception:
+            pass
+        # Failed; a later conversation may try again
+        with _EXPLANATION_LOCK:
+            _PREWARM_CLAIMED.discard(question.id)
+    
     def get_next_question(self) -> Optional[str]:
         """Get the next question to ask, considering branching logic"""
         if not self.current_template:
@@ -57,81 +705,24 @@ class ChatbotEngine:
     
     def _format_question(self, question: Question) -> str:
         """Format a question for conversational presentation"""
-        question_text = self._make_question_conversational(question.question_text)
+        cached = self._fmt_cache.get(question.id)
+        if cached is not None:
+            return cached
         
-        # Add response options for multiple choice questions in a conversational way
-        if question.field_responses and len(question.field_responses) > 0:
-            categorical_types = ['dropdown', 'drop down-single select', 'radio', 'single select']
-            if question.field_type.lower() in categorical_types:
-                if len(question.field_responses) <= 2:
-                    # For 2 options, show with "or"
-                    options = " or ".join([f"**{opt}**" for opt in question.field_responses])
-                    question_text += f"\n\nYou can answer: {options}"
-                elif len(question.field_responses) <= 4:
-                    # For 3-4 options, show with commas and "or"
-                    if len(question.field_responses) == 3:
-                        options = f"**{question.field_responses[0]}**, **{question.field_responses[1]}**, or **{question.field_responses[2]}**"
-                    else:  # 4 options
-                        options = f"**{question.field_responses[0]}**, **{question.field_responses[1]}**, **{question.field_responses[2]}**, or **{question.field_responses[3]}**"
-                    question_text += f"\n\nYou can choose: {options}"
-                else:
-                    # For 5+ options, use a clean numbered list
-                    options_list = "\n".join([f"{i+1}. **{opt}**" for i, opt in enumerate(question.field_responses)])
-                    question_text += f"\n\nPlease choose from these options:\n{options_list}"
-                    
-            elif question.field_type.lower() in ['checkbox', 'multi select']:
-                if len(question.field_responses) <= 3:
-                    # For short lists, show inline with commas
-                    options = ", ".join([f"**{opt}**" for opt in question.field_responses])
-                    question_text += f"\n\nYou can select: {options} (choose one or more)"
-                else:
-                    # For longer lists, use numbered format
-                    options_list = "\n".join([f"{i+1}. **{opt}**" for i, opt in enumerate(question.field_responses)])
-                    question_text += f"\n\nYou can select multiple options from:\n{options_list}"
-        
-        # Add format hints for specific field types
-        format_hints = {
-            'email': "💌 Please provide a valid email address (like john@example.com)",
-            'phone': "📞 Please provide your phone number (like 555-123-4567)",
-            'date': "📅 Please provide the date (like MM/DD/YYYY or January 1, 1990)",
-            'number': "🔢 Please provide a number",
-            'free text box': "💬 Please type your answer",
-            'text': "💬 Please type your answer"
-        }
+        info = self._info(question)
+        question_text = self._make_question_conversational(question.question_text)
         
-        field_type_lower = question.field_type.lower()
-        for hint_key, hint_text in format_hints.items():
-            if hint_key in field_type_lower:
-                question_text += f"\n\n{hint_text}"
-                break
+        # Options and format hint are rendered once per question in _question_info
+        question_text += info.prompt_suffix
         
+        self._fmt_cache[question.id] = question_text
         return question_text
     
     def _make_question_conversational(self, question_text: str) -> str:
         """Convert formal question text to conversational format"""
-        # Handle common patterns and make them more conversational
-        conversational_mappings = {
-            "Does individual have a court case?": "Do you currently have any ongoing court cases?",
-            "Referral source to Court:": "How did you find out about our court services?",
-            "City / Ciudad": "What city do you live in?",
-            "What is your monthly TANF benefit?": "Do you receive TANF benefits? If yes, what's your monthly amount?",
-            "Are you currently participating in any Y programs?": "Are you currently participating in any YMCA programs?",
-            "Program Currently Enrolled": "Which program are you currently enrolled in or interested in?",
-            "Secondary Contact Information to reach you (Phone Number)": "Is there another phone number we can reach you at?",
-            "Secondary Contact Information to reach you (Email)": "Do you have an alternate email address?",
-            "Preferred Method of contact (Select all that apply)": "How would you prefer us to contact you?",
-            "Preferred Language": "What language would you prefer for our communications?",
-            "Other phone or email": "Do you have any other contact information you'd like to share?",
-            "Pronouns (optional)": "What pronouns do you use? (This is optional)",
-            "Is the individual a Broomfield resident?": "Are you a Broomfield resident?",
-            "Does the individual have a history of substance abuse?": "Do you have a history of substance abuse?",
-            "What is the individual's drug of choice?": "What is your primary substance of concern?",
-            "Does the individual have a family history of substance abuse?": "Does your family have a history of substance abuse?"
-        }
-        
         # Check for exact matches first
-        if question_text in conversational_mappings:
-            return conversational_mappings[question_text]
+        if question_text in _CONV_MAP:
+            return _CONV_MAP[question_text]
         
         # Handle partial matches and common patterns
         text_lower = question_text.lower()
@@ -168,11 +759,8 @@ class ChatbotEngine:
         # If no specific mapping found, make it more conversational
         # Convert "individual" and "the individual" to "you"
         converted_text = question_text
-        converted_text = re.sub(r'\bthe individual\b', 'you', converted_text, flags=re.IGNORECASE)
-        converted_text = re.sub(r'\bindividual\b', 'you', converted_text, flags=re.IGNORECASE)
-        converted_text = re.sub(r'\bDoes you\b', 'Do you', converted_text, flags=re.IGNORECASE)
-        converted_text = re.sub(r'\bIs you\b', 'Are you', converted_text, flags=re.IGNORECASE)
-        converted_text = re.sub(r'\bHas you\b', 'Do you have', converted_text, flags=re.IGNORECASE)
+        for pattern, repl in _CONVERSATIONAL_SUBS:
+            converted_text = pattern.sub(repl, converted_text)
         
         if converted_text.endswith("?"):
             return converted_text
@@ -187,108 +775,53 @@ class ChatbotEngine:
             # Apply smart rules based on question content and previous answers
             return self._apply_smart_skip_rules(question)
         
-        # Parse conditional logic
-        logic = question.conditional_logic.lower().strip()
-        
-        # Handle common conditional patterns
-        try:
-            import re
-            
-            # Pattern 1: "If Q1 = 'Yes', show this question"
-            pattern1 = r'if\s+q?(\d+)\s*=\s*[\'"]?([^\'"]+)[\'"]?'
-            match1 = re.search(pattern1, logic)
+        cond = self._parsed_cond.get(question.id)
+        if cond:
+            op, question_num, expected_value = cond
+            actual_value = self._answers_by_number.get(question_num)
+            if actual_value is not None:
+                # Show only if values match / skip if values don't match
+                return actual_value != expected_value
             
-            if match1:
-                question_num = int(match1.group(1))
-                expected_value = match1.group(2).strip().lower()
-                
-                # Find the referenced question's answer
-                for q in self.current_template.questions:
-                    if q.number == question_num and q.id in self.responses:
-                        actual_value = self.responses[q.id].lower().strip()
-                        # Show only if values match
-                        return actual_value != expected_value
-                
-                # If referenced question not answered yet, skip for now
-                return True
-            
-            # Pattern 2: "Skip if Q2 != 'Married'"
-            pattern2 = r'skip\s+if\s+q?(\d+)\s*!=\s*[\'"]?([^\'"]+)[\'"]?'
-            match2 = re.search(pattern2, logic)
-            
-            if match2:
-                question_num = int(match2.group(1))
-                expected_value = match2.group(2).strip().lower()
-                
-                # Find the referenced question's answer
-                for q in self.current_template.questions:
-                    if q.number == question_num and q.id in self.responses:
-                        actual_value = self.responses[q.id].lower().strip()
-                        # Skip if values don't match
-                        return actual_value != expected_value
-                
-                # If referenced question not answered yet, don't skip
-                return False
-                
-        except (ValueError, AttributeError):
-            pass
+            # Referenced question not answered yet: hold back a "show if", keep a "skip if"
+            return op == "show"
         
         # Apply smart rules as fallback
         return self._apply_smart_skip_rules(question)
     
     def _apply_smart_skip_rules(self, question: Question) -> bool:
         """Apply smart rules to skip irrelevant questions based on context"""
-        question_text = question.question_text.lower()
+        question_text = self._info(question).text
         
         # Rule 1: Skip court-related follow-up questions if no court case
         if "referral source" in question_text and "court" in question_text:
             # Look for previous court case answer
-            for q in self.current_template.questions:
-                if "court case" in q.question_text.lower() and q.id in self.responses:
-                    answer = self.responses[q.id].lower().strip()
-                    if answer in ['no', 'n', 'none', 'not applicable', 'na']:
-                        return True  # Skip referral source question
+            for answer in self._tagged_answers("court_case"):
+                if answer in ['no', 'n', 'none', 'not applicable', 'na']:
+                    return True  # Skip referral source question
         
         # Rule 2: Skip spouse-related questions if not married
         if "spouse" in question_text or "partner" in question_text:
-            for q in self.current_template.questions:
-                if "married" in q.question_text.lower() or "marital" in q.question_text.lower():
-                    if q.id in self.responses:
-                        answer = self.responses[q.id].lower().strip()
-                        if answer in ['no', 'single', 'divorced', 'widowed', 'separated']:
-                            return True  # Skip spouse questions
-        
-        # Rule 3: Skip program-specific questions based on program selection
-        if "program" in question_text and any(prog in question_text for prog in ['dads', 'moms', 'epic', 'mend']):
-            # Look for program enrollment answer
-            for q in self.current_template.questions:
-                if "program" in q.question_text.lower() and "enrolled" in q.question_text.lower():
-                    if q.id in self.responses:
-                        answer = self.responses[q.id].lower()
-                        # Skip if this specific program wasn't selected
-                        if 'dads' in question_text and 'dads' not in answer:
-                            return True
-                        if 'epic' in question_text and 'epic' not in answer:
-                            return True
-                        if 'mend' in question_text and 'mend' not in answer:
-                            return True
+            for answer in self._tagged_answers("marital"):
+                if answer in ['no', 'single', 'divorced', 'widowed', 'separated']:
+                    return True  # Skip spouse questions
+        
+        # Rule 3: Skip program-specific questions if an enrollment answer leaves out their program
+        program_mask = self._info(question).program_mask
+        if program_mask and any(program_mask & ~enrolled for enrolled in self._enrolled_masks.values()):
+            return True
         
         # Rule 4: Skip benefit amount questions if person doesn't receive benefits
         if "benefit" in question_text and ("amount" in question_text or "monthly" in question_text):
-            for q in self.current_template.questions:
-                if "benefit" in q.question_text.lower() and q.id in self.responses:
-                    answer = self.responses[q.id].lower().strip()
-                    if answer in ['no', 'none', '0', 'not applicable', 'na', 'do not receive']:
-                        return True  # Skip amount questions
+            for answer in self._tagged_answers("benefits"):
+                if answer in ['no', 'none', '0', 'not applicable', 'na', 'do not receive']:
+                    return True  # Skip amount questions
         
         # Rule 5: Skip secondary contact if person prefers not to provide
         if "secondary" in question_text or "alternate" in question_text:
             # Check if they indicated they don't want to provide additional contact
-            for q in self.current_template.questions:
-                if q.id in self.responses:
-                    answer = self.responses[q.id].lower().strip()
-                    if answer in ['no', 'none', 'not needed', 'no thanks', 'skip']:
-                        return True
+            if any(self._answer_counts[answer] for answer in ['no', 'none', 'not needed', 'no thanks', 'skip']):
+                return True
         
         return False  # Don't skip by default
     
@@ -300,20 +833,25 @@ class ChatbotEngine:
         if not self.current_question:
             return "I don't have a current question. Let me get the next one for you.", False, None
         
+        # Casefold once per turn; intent detection, validation and storage share it
+        user_lower = user_input.casefold()
+        intent = self._detect_intent(user_input, user_lower)
+        
         # Check if user is asking for help or expressing confusion
-        if self._is_help_request(user_input) or self._is_confusion_expression(user_input):
+        if intent == "explain":
             return self._generate_intelligent_explanation(user_input), False, None
         
         # Check if user is avoiding the question
-        if self._is_avoidance(user_input):
+        if intent == "avoid":
             return self._handle_avoidance(), False, None
         
         # Validate the answer
-        is_valid, suggestion = self._validate_answer(user_input, self.current_question)
+        answer_norm = user_lower.strip()
+        is_valid, suggestion = self._validate_answer(user_input, self.current_question, answer_norm)
         
         if is_valid:
             # Store the answer
-            self.responses[self.current_question.id] = user_input
+            self._record_answer(self.current_question, user_input, answer_norm)
             
             # Update personal/address info if applicable
             self._update_standard_fields(self.current_question, user_input)
@@ -332,213 +870,194 @@ class ChatbotEngine:
         else:
             return f"I need a bit more information. {suggestion}", False, suggestion
     
-    def _is_help_request(self, user_input: str) -> bool:
+    def _record_answer(self, question: Question, answer: str, normalized: Optional[str] = None):
+        """Store an answer and keep the lookup indices used by the skip rules in step"""
+        previous = self._responses_lower.get(question.id)
+        if previous is not None:
+            self._answer_counts[previous] -= 1
+        if normalized is None:
+            normalized = answer.casefold().strip()
+        self.responses[question.id] = answer
+        self._responses_lower[question.id] = normalized
+        self._answers_by_number[question.number] = normalized
+        self._answer_counts[normalized] += 1
+        if question.id in self._tag_index.get("program_enrollment", ()):
+            self._enrolled_masks[question.id] = _program_mask(normalized)
+    
+    def _tagged_answers(self, tag: str) -> List[str]:
+        """Normalized answers to the template questions carrying a skip-rule tag"""
+        return [self._responses_lower[qid] for qid in self._tag_index.get(tag, ()) if qid in self._responses_lower]
+    
+    def _detect_intent(self, user_input: str, user_lower: Optional[str] = None) -> Optional[str]:
+        """Classify a reply as "explain" (help/confusion), "avoid", or None for a plain answer"""
+        if user_lower is None:
+            user_lower = user_input.lower()
+        if not any(trigger in user_lower for trigger in _INTENT_TRIGGERS):
+            return None
+        if _EXPLAIN_RE.search(user_lower):
+            return "explain"
+        if _AVOIDANCE_RE.search(user_lower):
+            return "avoid"
+        return None
+    
+    def _is_help_request(self, user_input: str, user_lower: Optional[str] = None) -> bool:
         """Check if user is asking for help about the question"""
-        help_patterns = [
-            r"why.*need.*this",
-            r"why.*ask.*this",
-            r"what.*for",
-            r"help",
-            r"explain",
-            r"don't understand",
-            r"not sure",
-            r"what.*mean",
-            r"what does.*mean",
-            r"what is.*mean",
-            r"what is \w+",  # "what is juvenile"
-            r"what does \w+",  # "what does substance"
-            r".*what does this mean",
-            r".*what is this",
-            r"can you explain",
-            r"can you share",
-            r"tell me about",
-            r"how.*used",
-            r"what.*happen.*with",
-            r"what.*do.*with"
-        ]
-        
-        user_lower = user_input.lower()
-        return any(re.search(pattern, user_lower) for pattern in help_patterns)
+        return _HELP_RE.search(user_input.lower() if user_lower is None else user_lower) is not None
     
-    def _is_avoidance(self, user_input: str) -> bool:
+    def _is_avoidance(self, user_input: str, user_lower: Optional[str] = None) -> bool:
         """Check if user is avoiding answering the question"""
-        avoidance_patterns = [
-            r"don[''']?t want to answer",
-            r"dotn[''']? want to answer",
-            r"dont want to answer",
-            r"skip this",
-            r"pass",
-            r"next question",
-            r"don[''']?t want to say",
-            r"prefer not to",
-            r"rather not",
-            r"none of your business",
-            r"private",
-            r"can[''']?t answer"
-        ]
-        
-        user_lower = user_input.lower()
-        return any(re.search(pattern, user_lower) for pattern in avoidance_patterns)
+        return _AVOIDANCE_RE.search(user_input.lower() if user_lower is None else user_lower) is not None
     
-    def _is_confusion_expression(self, user_input: str) -> bool:
+    def _is_confusion_expression(self, user_input: str, user_lower: Optional[str] = None) -> bool:
         """Check if user is expressing confusion or asking why"""
-        confusion_patterns = [
-            r"i don[''']?t get it",
-            r"don[''']?t understand",
-            r"why.*question",
-            r"why.*ask",
-            r"confused",
-            r"what does this mean",
-            r"i don[''']?t know why",
-            r"not sure why",
-            r"why do you need",
-            r"what[''']?s the point"
-        ]
-        
-        user_lower = user_input.lower()
-        return any(re.search(pattern, user_lower) for pattern in confusion_patterns)
+        return _CONFUSION_RE.search(user_input.lower() if user_lower is None else user_lower) is not None
     
     def _generate_intelligent_explanation(self, user_input: str) -> str:
         """Generate an intelligent explanation using GPT-4o mini"""
+        return "".join(self.stream_intelligent_explanation(user_input))
+    
+    def stream_intelligent_explanation(self, user_input: str) -> Iterator[str]:
+        """Yield the explanation as it streams from GPT-4o mini, for st.write_stream"""
+        suffix = "\n\nWould you like to answer the question now?"
+        streamed = []
+        pending = ""
         try:
             question_text = self.current_question.question_text
+            cache_key = (self.current_question.id, _explanation_intent(user_input))
+            explanation = _cached_explanation(cache_key)
+            if explanation is not None:
+                yield f"{explanation}{suffix}"
+                return
             
-            prompt = f"""
-            You are a helpful assistant for a social services intake form. A user is confused about this question: "{question_text}"
-            
-            The user said: "{user_input}"
-            
-            Please provide a brief, empathetic explanation (2-3 sentences) about:
-            1. Why this information is needed for social services
-            2. How it helps connect them with appropriate resources
-            3. Reassure them about privacy/confidentiality if relevant
-            
-            Be conversational, friendly, and understanding. Don't repeat the question.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a compassionate social services intake assistant."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.7
-            )
+            # The slot covers opening the stream; it is released before tokens
+            # reach the UI so a slow reader cannot hold it
+            with _openai_slot():
+                stream = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=_explanation_messages(question_text, user_input),
+                    max_tokens=_EXPLANATION_MAX_TOKENS,
+                    temperature=0.4,
+                    stream=True
+                )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                token = chunk.choices[0].delta.content
+                if not token:
+                    continue
+                # Outer whitespace is held back so the result matches the stripped reply
+                text = pending + token
+                if not streamed:
+                    text = text.lstrip()
+                body = text.rstrip()
+                pending = text[len(body):]
+                if body:
+                    streamed.append(body)
+                    yield body
             
-            explanation = response.choices[0].message.content.strip()
-            return f"{explanation}\n\nWould you like to answer the question now?"
+            explanation = "".join(streamed)
+            if not explanation:
+                raise ValueError("empty explanation")
+            _store_explanation(cache_key, explanation)
+            yield suffix
             
         except Exception as e:
-            # Fallback explanation
-            if not self.current_question:
-                return "I understand you have questions. Let me help clarify what we need and why."
-            
-            question_text = self.current_question.question_text
-            fallback_explanations = {
-                "drug": "I understand this feels personal. We ask about substance use so we can connect you with the right support services if needed. This information is confidential and helps us provide better care.",
-                "substance abuse": "History of substance abuse means past or current problems with drugs or alcohol that have affected your life, work, relationships, or health. We ask this to understand what support services might be helpful for you.",
-                "substance": "This helps us understand what kind of support might be helpful. All information is kept private and only used to connect you with appropriate resources.",
-                "history": "Family history helps us understand potential risk factors and provide better support. This information is confidential and helps our team serve you better.",
-                "court": "Legal information helps us understand any constraints or needs you might have. This ensures we provide appropriate services and support.",
-                "find out": "We ask how you heard about us to understand which outreach methods work best and to improve our services. This helps us serve the community better.",
-                "services": "Understanding how you found us helps us improve our outreach and ensures we're reaching people who need our help most effectively.",
-                "referred": "We ask about referrals to understand what services you've already tried and coordinate your care better.",
-                "treatment": "We ask about treatment to understand your care history and avoid duplication of services.",
-                "resources": "We want to know what resources you've been offered so we can build on existing support and avoid gaps in care.",
-                "juvenile": "Juvenile means under 18 years old. We ask this because different services and legal protections apply to minors versus adults.",
-                "adult": "Adult means 18 years old or older. This determines which services and legal frameworks apply to your situation."
-            }
-            
-            # Check for specific term questions first
-            user_lower = user_input.lower()
-            
-            # Handle juvenile/adult questions
-            if ("what is juvenile" in user_lower or "what is adult" in user_lower) and "juvenile" in question_text.lower():
-                return "Juvenile means under 18 years old. We ask this because different services and legal protections apply to minors versus adults.\n\nWould you like to answer the question now?"
-            
-            # Handle residence questions  
-            if ("who would be considered" in user_lower or "what is.*resident" in user_lower) and "resident" in question_text.lower():
-                return "A Broomfield resident is someone who lives within the city limits of Broomfield, Colorado. This determines eligibility for certain local services and programs.\n\nWould you like to answer the question now?"
-            
-            # Handle substance questions
-            if ("substance abuse" in user_lower or "what does this mean" in user_lower) and "substance" in question_text.lower():
-                return "History of substance abuse means past or current problems with drugs or alcohol that have affected your life, work, relationships, or health. We ask this to understand what support services might be helpful for you.\n\nWould you like to answer the question now?"
-            
-            question_lower = question_text.lower()
-            for key, explanation in fallback_explanations.items():
-                if key in question_lower:
-                    return f"{explanation}\n\nWould you like to answer the question now?"
-            
-            return f"I understand this question might seem unclear. We ask this to better understand your situation and connect you with the most helpful resources. All information is confidential. Would you like to answer the question now?"
+            if streamed:
+                # The stream broke part-way; close out what the user already saw
+                yield suffix
+                return
+            yield self._fallback_explanation(user_input)
+    
+    def _fallback_explanation(self, user_input: str) -> str:
+        """Canned explanation used when GPT is unavailable"""
+        # Fallback explanation
+        if not self.current_question:
+            return "I understand you have questions. Let me help clarify what we need and why."
+        
+        question_lower = self._info(self.current_question).text
+        
+        # Check for specific term questions first
+        user_lower = user_input.lower()
+        
+        # Handle juvenile/adult questions
+        if ("what is juvenile" in user_lower or "what is adult" in user_lower) and "juvenile" in question_lower:
+            return "Juvenile means under 18 years old. We ask this because different services and legal protections apply to minors versus adults.\n\nWould you like to answer the question now?"
+        
+        # Handle residence questions  
+        if ("who would be considered" in user_lower or "what is.*resident" in user_lower) and "resident" in question_lower:
+            return "A Broomfield resident is someone who lives within the city limits of Broomfield, Colorado. This determines eligibility for certain local services and programs.\n\nWould you like to answer the question now?"
+        
+        # Handle substance questions
+        if ("substance abuse" in user_lower or "what does this mean" in user_lower) and "substance" in question_lower:
+            return "History of substance abuse means past or current problems with drugs or alcohol that have affected your life, work, relationships, or health. We ask this to understand what support services might be helpful for you.\n\nWould you like to answer the question now?"
+        
+        keys = _FALLBACK_RE.findall(question_lower)
+        if keys:
+            explanation = _FALLBACK_EXPLANATIONS[min(keys, key=_FALLBACK_PRIORITY.__getitem__)]
+            return f"{explanation}\n\nWould you like to answer the question now?"
+        
+        return f"I understand this question might seem unclear. We ask this to better understand your situation and connect you with the most helpful resources. All information is confidential. Would you like to answer the question now?"
     
     def _handle_avoidance(self) -> str:
         """Handle when user avoids answering a question"""
         question_text = self.current_question.question_text
         
-        persuasion_messages = [
-            f"I understand this question might feel personal. However, answering '{question_text}' helps us provide you with the most appropriate support and resources. Your information is completely confidential and only used to help you better.",
-            f"I know some questions can be uncomfortable, but '{question_text}' is important for connecting you with the right services. All your responses are kept private and secure. Would you be willing to share this information?",
-            f"This question might seem intrusive, but '{question_text}' helps our team understand your needs better. Everything you share is confidential and helps us serve you more effectively. Could you help us by answering?"
-        ]
-        
-        import random
-        message = random.choice(persuasion_messages)
+        # Rotate through the persuasion messages
+        message = _PERSUADE[self._persuade_idx % len(_PERSUADE)].format(q=question_text)
+        self._persuade_idx += 1
         
         # Add options if it's a multiple choice question
         if self.current_question.field_responses:
             if len(self.current_question.field_responses) <= 4:
-                options = " • ".join(self.current_question.field_responses)
-                message += f"\n\nYour options are: {options}"
+                message += f"\n\nYour options are: {self._info(self.current_question).options_text}"
         
         return message
     
-    def _validate_answer(self, answer: str, question: Question) -> Tuple[bool, Optional[str]]:
-        """Validate user's answer against question requirements"""
+    def _validate_answer(self, answer: str, question: Question, answer_lower: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Validate user's answer against question requirements (answer_lower: casefolded, stripped)"""
         answer = answer.strip()
+        if answer_lower is None:
+            answer_lower = answer.casefold()
         
         if not answer:
             return False, "Please provide an answer to continue."
         
-        field_type = question.field_type.lower()
+        info = self._info(question)
+        
+        # Fast path: an exact option pick on a categorical question needs no further checks
+        if answer_lower in info.exact_options:
+            return True, None
+        
+        field_type = info.field_type
         
         # Email validation
         if 'email' in field_type:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, answer):
+            if not _EMAIL_RE.match(answer):
                 return False, "Please provide a valid email address (e.g., john@example.com)"
         
         # Phone validation
-        elif 'phone' in field_type or 'phone' in question.question_text.lower():
-            phone_pattern = r'[\d\s\-\(\)]{10,}'
-            if not re.search(phone_pattern, answer):
+        elif 'phone' in field_type or 'phone' in info.text:
+            if not _PHONE_RE.search(answer):
                 return False, "Please provide a valid phone number with at least 10 digits (e.g., 555-123-4567)"
         
         # Date validation
-        elif 'date' in field_type or 'birth' in question.question_text.lower():
-            date_patterns = [
-                r'\d{1,2}[/-]\d{1,2}[/-]\d{4}',
-                r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
-                r'[A-Za-z]+ \d{1,2},? \d{4}'
-            ]
-            if not any(re.search(pattern, answer) for pattern in date_patterns):
+        elif 'date' in field_type or 'birth' in info.text:
+            if not _DATE_RE.search(answer):
                 return False, "Please provide a valid date (e.g., 01/15/1990, January 15, 1990, or 1990-01-15)"
         
         # Number validation
         elif 'number' in field_type or '$' in question.question_text:
-            if not re.search(r'\d+', answer):
+            if not _NUMBER_RE.search(answer):
                 return False, "Please provide a number (digits only or with dollar sign for money amounts)"
         
         # Multiple choice validation
         elif question.field_responses and len(question.field_responses) > 0:
-            categorical_types = ['dropdown', 'drop down-single select', 'radio', 'single select']
-            if field_type in categorical_types:
+            if info.is_categorical:
                 # Check if answer matches one of the options (case insensitive, flexible matching)
-                valid_options = [opt.lower().strip() for opt in question.field_responses]
-                answer_lower = answer.lower().strip()
+                valid_options = info.stripped_options
                 
                 # Exact match first
-                if answer_lower in valid_options:
+                if answer_lower in info.option_set:
                     return True, None
                 
                 # Partial match (for cases like "Yes" matching "Yes - option")
@@ -547,49 +1066,39 @@ class ChatbotEngine:
                         return True, None
                 
                 # Special handling for common responses
-                if answer_lower in ['y', 'yes', 'yep', 'yeah'] and any('yes' in opt.lower() for opt in valid_options):
+                if answer_lower in _YES_TOKENS and info.accepts_yes:
                     return True, None
-                elif answer_lower in ['n', 'no', 'nope', 'nah'] and any('no' in opt.lower() for opt in valid_options):
+                elif answer_lower in _NO_TOKENS and info.accepts_no:
                     return True, None
                 
                 # For Yes/No questions, if answer is completely irrelevant, give special guidance
-                if len(question.field_responses) == 2 and all(opt.lower() in ['yes', 'no'] for opt in [r.lower() for r in question.field_responses]):
+                if info.is_yes_no:
                     if len(answer.split()) > 3:  # Long irrelevant answer
-                        return False, f"This question needs a simple Yes or No answer. Please choose: {' or '.join(question.field_responses)}"
+                        return False, info.yes_no_error
                 
-                options_text = " • ".join(question.field_responses)
-                return False, f"Please choose one of these options: {options_text}"
+                return False, info.choice_error
             
-            elif field_type in ['checkbox', 'multi select']:
+            elif info.is_multi_select:
                 # For multi-select, check if at least one option is mentioned
-                answer_lower = answer.lower()
-                valid_options = [opt.lower() for opt in question.field_responses]
-                
                 # Check if any valid option is mentioned
-                found_options = []
-                for opt in question.field_responses:
-                    if opt.lower() in answer_lower:
-                        found_options.append(opt)
-                
-                if found_options:
+                if info.option_re.search(answer_lower):
                     return True, None
                 
-                options_text = " • ".join(question.field_responses)
-                return False, f"Please select from these options: {options_text}"
+                return False, info.select_error
         
         # Debug: print field type and responses to understand the data
-        print(f"DEBUG: Field type: '{field_type}', Has responses: {bool(question.field_responses)}, Response count: {len(question.field_responses) if question.field_responses else 0}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Field type: '%s', Has responses: %s, Response count: %d",
+                         field_type, bool(info.options), len(info.options))
         
         # For descriptive/text answers, use GPT to validate relevance and provide examples
         # Also check questions without specific response options (open-ended)
         # AND validate any answer that's clearly not matching the multiple choice options
         should_validate_with_gpt = (
             field_type in ['text', 'free text box', 'textarea'] or 
-            (not question.field_responses or len(question.field_responses) == 0) or
+            not info.options or
             # If it's a multiple choice but answer doesn't match any option, validate with GPT
-            (question.field_responses and len(question.field_responses) > 0 and 
-             not any(answer.lower().strip() in opt.lower() for opt in question.field_responses) and
-             not any(opt.lower() in answer.lower().strip() for opt in question.field_responses))
+            not any(answer_lower in opt or opt in answer_lower for opt in info.options)
         )
         
         if should_validate_with_gpt:
@@ -599,63 +1108,110 @@ class ChatbotEngine:
     
     def _validate_descriptive_answer(self, answer: str, question: Question) -> Tuple[bool, Optional[str]]:
         """Use GPT to validate descriptive answers and provide examples if needed"""
+        normalized = _normalize_text(answer)
+        
+        # Local shortcuts: a question back to us is never an answer, and a bare
+        # yes/no to a yes/no question needs no relevance check
+        if _META_QUESTION_RE.match(normalized) or (answer.rstrip().endswith('?') and _QUESTION_OPENER_RE.match(normalized)):
+            return False, f"I understand you're asking about this. {self._question_reason(question)}"
+        if normalized in _YES_NO_TOKENS and self._info(question).text.startswith(_YES_NO_QUESTION_STARTS):
+            return True, None
+        
+        cache_key = (question.id, normalized)
+        with _VALIDATION_LOCK:
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                _VALIDATION_CACHE.move_to_end(cache_key)
+                return cached
+            recent = _recent_verdicts(question.id) if len(normalized) >= _VALIDATION_FUZZY_MIN_LEN else []
+        
+        # Similarity is scored outside the lock so other sessions are not held up
+        similar = _similar_cached_verdict(normalized, recent)
+        if similar is True:
+            return True, None
+        if similar is False:
+            return False, f"That doesn't seem to answer this question. {self._question_reason(question)}"
+        
+        with _VALIDATION_LOCK:
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            pending = _VALIDATION_INFLIGHT.get(cache_key)
+            if pending is None:
+                future = _VALIDATION_INFLIGHT[cache_key] = Future()
+        
+        if pending is not None:
+            # Another session is already checking this answer; share its verdict
+            return pending.result()
+        
+        verdict = (True, None)
         try:
-            # Debug logging
-            print(f"DEBUG: Validating answer '{answer}' for question '{question.question_text}'")
-            prompt = f"""
-            You are validating a user's response to a social services intake form question. 
-
-            Question: "{question.question_text}"
-            User's Response: "{answer}"
-
-            Analyze the user's response and determine:
-            1. Is this a QUESTION back to you? (like "how is this used?", "why do you need this?")
-            2. Is this an ANSWER that's relevant to the question asked?
-            3. Is this an ANSWER but completely unrelated/off-topic?
-
-            Rules:
-            - If it's a QUESTION, mark as invalid and explain why the info is needed
-            - If it's an ANSWER but irrelevant, mark as invalid and provide a good example
-            - If it's a relevant ANSWER, mark as valid
-
-            Respond in this exact format:
-            VALID: true/false
-            TYPE: question/answer/off-topic
-            REASON: Brief explanation if invalid
-            EXAMPLE: Good answer example if needed (realistic and short)
-            """
-
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a social services intake form validator. Be helpful but concise."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.3
-            )
-            
-            result = response.choices[0].message.content.strip()
-            
-            # Parse the response
-            lines = result.split('\n')
-            is_valid = False
-            response_type = ""
-            reason = ""
-            example = ""
+            verdict = self._request_validation(answer, question, cache_key)
+        finally:
+            future.set_result(verdict)
+            with _VALIDATION_LOCK:
+                _VALIDATION_INFLIGHT.pop(cache_key, None)
+        return verdict
+    
+    def _question_reason(self, question: Question) -> str:
+        """Why a question is asked, from the explanation cache or the canned fallbacks"""
+        explanation = _cached_explanation((question.id, _explanation_intent(_PREWARM_QUESTION)))
+        if explanation is not None:
+            return explanation
+        keys = _FALLBACK_RE.findall(self._info(question).text)
+        if keys:
+            return _FALLBACK_EXPLANATIONS[min(keys, key=_FALLBACK_PRIORITY.__getitem__)]
+        return "We ask this to better understand your situation and connect you with the most helpful resources. All information is confidential."
+    
+    def _request_validation(self, answer: str, question: Question, cache_key: Tuple[str, str]) -> Tuple[bool, Optional[str]]:
+        """Ask GPT whether a free-text answer fits the question, caching the verdict"""
+        try:
+            logger.debug("Validating answer '%s' for question '%s'", answer, question.question_text)
+            prompt = f"Question: \"{question.question_text}\"\nUser's Response: \"{answer}\""
+
+            # Streamed so a true verdict ends the call without decoding the rest;
+            # only invalid answers need the reason and example
+            chunks = []
+            verdict_seen = False
+            valid_early = False
+            with _openai_slot():
+                stream = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": _VALIDATOR_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=200,
+                    temperature=0.3,
+                    response_format=_VALIDATION_RESPONSE_FORMAT,
+                    stream=True
+                )
+                try:
+                    for chunk in stream:
+                        if not chunk.choices or not chunk.choices[0].delta.content:
+                            continue
+                        chunks.append(chunk.choices[0].delta.content)
+                        if not verdict_seen:
+                            head = _VALID_HEAD_RE.match("".join(chunks))
+                            if head:
+                                verdict_seen = True
+                                if head.group(1) == "true":
+                                    valid_early = True
+                                    break
+                finally:
+                    stream.close()
             
-            for line in lines:
-                if line.startswith('VALID:'):
-                    is_valid = 'true' in line.lower()
-                elif line.startswith('TYPE:'):
-                    response_type = line.replace('TYPE:', '').strip().lower()
-                elif line.startswith('REASON:'):
-                    reason = line.replace('REASON:', '').strip()
-                elif line.startswith('EXAMPLE:'):
-                    example = line.replace('EXAMPLE:', '').strip()
+            if valid_early:
+                is_valid = True
+            else:
+                data = json.loads("".join(chunks))
+                is_valid = data.get("valid") is True
+                response_type = str(data.get("type", "")).lower()
+                reason = str(data.get("reason", "")).strip()
+                example = str(data.get("example", "")).strip()
             
             if is_valid:
-                return True, None
+                verdict = (True, None)
             else:
                 if response_type == "question":
                     # User asked a question - provide explanation
@@ -668,129 +1224,110 @@ class ChatbotEngine:
                     if example:
                         suggestion += f"\n\n💡 **Example of a good answer:** {example}"
                 
-                return False, suggestion
+                verdict = (False, suggestion)
+            
+            with _VALIDATION_LOCK:
+                _VALIDATION_CACHE[cache_key] = verdict
+                if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+                    _VALIDATION_CACHE.popitem(last=False)
+                recent = _VALIDATION_RECENT.setdefault(question.id, deque(maxlen=_VALIDATION_RECENT_SIZE))
+                if cache_key[1] not in recent:
+                    recent.append(cache_key[1])
+            return verdict
                 
         except Exception as e:
             # If GPT validation fails, accept the answer
-            print(f"GPT validation error: {e}")
+            logger.warning("GPT validation error: %s", e)
             return True, None
     
     def _update_standard_fields(self, question: Question, answer: str):
         """Update standard personal/address info based on question content"""
-        question_lower = question.question_text.lower()
-        
-        # Personal info mappings
-        if 'first name' in question_lower:
-            self.personal_info.person_first_name = answer
-        elif 'last name' in question_lower:
-            self.personal_info.person_last_name = answer
-        elif 'email' in question_lower:
-            self.personal_info.person_email_address = answer
-        elif 'phone' in question_lower:
-            self.personal_info.person_phone_number = answer
-        elif 'birth' in question_lower or 'age' in question_lower:
-            self.personal_info.person_date_of_birth = answer
-        elif 'gender' in question_lower:
-            self.personal_info.person_gender = answer
-        elif 'race' in question_lower:
-            self.personal_info.person_race = answer
-        elif 'ethnicity' in question_lower:
-            self.personal_info.person_ethnicity = answer
-        elif 'marital' in question_lower:
-            self.personal_info.person_marital_status = answer
-        
-        # Address info mappings
-        elif 'address' in question_lower and 'line 1' in question_lower:
-            self.address_info.address_line_1 = answer
-        elif 'city' in question_lower:
-            self.address_info.address_city = answer
-        elif 'state' in question_lower:
-            self.address_info.address_state = answer
-        elif 'zip' in question_lower or 'postal' in question_lower:
-            self.address_info.address_postal_code = answer
+        target = self._info(question).standard_field
+        if target is not None:
+            section, field_name = target
+            setattr(getattr(self, section), field_name, answer)
     
     def _generate_confirmation(self, answer: str) -> str:
         """Generate a friendly confirmation message"""
-        confirmations = [
-            f"Got it! I've recorded your answer: {answer}",
-            f"Thank you! I've noted: {answer}",
-            f"Perfect! I've saved: {answer}",
-            f"Excellent! I've recorded: {answer}"
-        ]
-        
-        import random
-        return random.choice(confirmations)
+        return _CONFIRMATIONS[random.randrange(len(_CONFIRMATIONS))].format(answer=answer)
     
     def generate_summary(self) -> str:
         """Generate a summary of all responses"""
         if not self.current_template:
             return "No form data available."
         
-        summary = f"## Summary of {self.current_template.name}\n\n"
+        parts = [self._summary_header]
         
         # Add personal info
-        if self.personal_info.person_first_name or self.personal_info.person_last_name:
-            summary += "**Personal Information:**\n"
-            if self.personal_info.person_first_name:
-                summary += f"• Name: {self.personal_info.person_first_name}"
-                if self.personal_info.person_last_name:
-                    summary += f" {self.personal_info.person_last_name}"
-                summary += "\n"
-            if self.personal_info.person_email_address:
-                summary += f"• Email: {self.personal_info.person_email_address}\n"
-            if self.personal_info.person_phone_number:
-                summary += f"• Phone: {self.personal_info.person_phone_number}\n"
-            summary += "\n"
-        
-        # Add custom responses
+        info = self.personal_info
+        if info.person_first_name or info.person_last_name:
+            parts.append("**Personal Information:**\n")
+            if info.person_first_name:
+                parts.append(f"• Name: {info.person_first_name}")
+                if info.person_last_name:
+                    parts.append(f" {info.person_last_name}")
+                parts.append("\n")
+            for label, field_name in _SUMMARY_CONTACT_FIELDS:
+                value = getattr(info, field_name)
+                if value:
+                    parts.append(f"• {label}: {value}\n")
+            parts.append("\n")
+        
+        # Add custom responses, in template order
         if self.responses:
-            summary += "**Your Responses:**\n"
-            for question in self.current_template.questions:
-                if question.id in self.responses:
-                    summary += f"• {question.question_text}: {self.responses[question.id]}\n"
+            parts.append("**Your Responses:**\n")
+            responses = self.responses
+            parts.extend(f"{prefix}{responses[qid]}\n" for qid, prefix in self._summary_lines.items() if qid in responses)
         
-        return summary
+        return "".join(parts)
     
-    def create_assistance_request(self, description: str = "Assistance request from chatbot") -> AssistanceRequest:
+    def create_assistance_request(self, description: str = "Assistance request from chatbot",
+                                  service_id: Optional[str] = None, provider_id: Optional[str] = None,
+                                  case_id: Optional[str] = None) -> AssistanceRequest:
         """Create an AssistanceRequest object from the collected data"""
-        import uuid
-        
+        # Matched service/provider/case IDs can be passed in; only missing ones are generated
+        now = datetime.now()
         return AssistanceRequest(
             assistance_request_id=str(uuid.uuid4()),
             description=description,
-            service_id=str(uuid.uuid4()),
-            provider_id=str(uuid.uuid4()),
-            case_id=str(uuid.uuid4()),
+            service_id=service_id or str(uuid.uuid4()),
+            provider_id=provider_id or str(uuid.uuid4()),
+            case_id=case_id or str(uuid.uuid4()),
             form_id=self.current_template.id if self.current_template else str(uuid.uuid4()),
             personal_info=self.personal_info,
             address_info=self.address_info,
             custom_responses=self.responses,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
     
     def get_faq_answer(self, question_text: str) -> str:
         """Get FAQ answer using OpenAI"""
+        cache_key = _normalize_text(question_text)
+        with _FAQ_LOCK:
+            answer = _FAQ_CACHE.get(cache_key)
+            if answer is not None:
+                _FAQ_CACHE.move_to_end(cache_key)
+                return answer
+        
         try:
-            prompt = f"""
-            You are a helpful assistant for an intake form system. A user is asking about why certain information is needed in an intake form.
-
-            User question: {question_text}
-
-            Provide a brief, friendly explanation (2-3 sentences) about why this information might be needed for social services, healthcare, or community assistance programs. Focus on how it helps connect them with appropriate resources and services.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant explaining why intake form information is collected."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.7
-            )
+            with _openai_slot():
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": _FAQ_SYSTEM_PROMPT},
+                        {"role": "user", "content": f"User question: {question_text}"}
+                    ],
+                    max_tokens=150,
+                    temperature=0.7
+                )
             
-            return response.choices[0].message.content.strip()
+            answer = response.choices[0].message.content.strip()
+            with _FAQ_LOCK:
+                _FAQ_CACHE[cache_key] = answer
+                if len(_FAQ_CACHE) > _FAQ_CACHE_SIZE:
+                    _FAQ_CACHE.popitem(last=False)
+            return answer
             
         except Exception as e:
             return "This information helps us better understand your needs and connect you with appropriate resources and services."
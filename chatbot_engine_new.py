@@ -1,25 +1,375 @@
 import openai
-from typing import Dict, List, Optional, Any, Tuple
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 import json
+import logging
 import re
 from datetime import datetime
 from data_models import Question, FormTemplate, AssistanceRequest, PersonalInfo, AddressInfo
 import config
 
+logger = logging.getLogger(__name__)
+
+# Skip conditions: a question whose conditional logic mentions the phrase is skipped once
+# any answer to a question whose text contains the keyword includes "no"
+_SKIP_CONDITIONS = (
+    ("not married", "married"),
+    ("no court case", "court"),
+    ("no substance", "substance"),
+    ("no benefits", "benefit"),
+)
+
+@functools.lru_cache(maxsize=256)
+def _skip_keywords(conditional_logic: str) -> Tuple[str, ...]:
+    """Keywords of the skip conditions a conditional logic string refers to"""
+    logic = conditional_logic.lower()
+    return tuple(keyword for condition, keyword in _SKIP_CONDITIONS if condition in logic)
+
+# Standard field filled by a question, by keywords in its text. Each alternative is a
+# lookahead from the start, so the first rule that matches anywhere wins and the group
+# name is the PersonalInfo/AddressInfo attribute to set
+_STANDARD_FIELD_RE = re.compile("|".join(
+    rf"^(?={pattern})" for pattern in (
+        r"[\s\S]*?(?P<person_first_name>first name)",
+        r"[\s\S]*?(?P<person_last_name>last name)",
+        r"[\s\S]*?(?P<person_email_address>email)",
+        r"[\s\S]*?(?P<person_phone_number>phone)",
+        r"[\s\S]*?(?P<person_date_of_birth>birth|age)",
+        r"[\s\S]*?(?P<person_gender>gender)",
+        r"[\s\S]*?(?P<person_race>race)",
+        r"(?=[\s\S]*?address)[\s\S]*?(?P<address_line_1>line 1)",
+        r"[\s\S]*?(?P<address_city>city)",
+        r"[\s\S]*?(?P<address_state>state)",
+        r"[\s\S]*?(?P<address_postal_code>zip|postal)",
+    )
+))
+
+# Confirmation phrasings, cycled per recorded answer
+_CONFIRMATIONS = (
+    "Got it! I've recorded your answer: {answer}",
+    "Thank you! I've noted: {answer}",
+    "Perfect! I've saved: {answer}",
+    "Excellent! I've recorded: {answer}"
+)
+
+# Words ending in 's' that are not third-person verbs
+_NOT_THIRD_PERSON = frozenset({'always', 'sometimes', 'perhaps', 'alias', 'focus'})
+_IRREGULAR_SECOND_PERSON = {'is': 'are', 'was': 'were', 'has': 'have', 'does': 'do'}
+
+def _second_person(match: re.Match) -> str:
+    """'you' plus the verb that followed 'the individual', conjugated for 'you'"""
+    adverb, verb = match.group(1) or "", match.group(2)
+    lower = verb.lower()
+    if lower in _IRREGULAR_SECOND_PERSON:
+        verb = _IRREGULAR_SECOND_PERSON[lower]
+    elif lower in _NOT_THIRD_PERSON or lower.endswith(('ss', 'us')):
+        pass
+    elif lower.endswith('ies') and len(lower) > 4:
+        verb = verb[:-3] + 'y'
+    elif lower.endswith(('sses', 'shes', 'ches', 'xes', 'zes', 'oes')):
+        verb = verb[:-2]
+    elif lower.endswith('s'):
+        verb = verb[:-1]
+    return f"you {adverb}{verb}"
+
+def _match_case(repl: str):
+    """Substitution keeping the matched text's leading capital, or lack of one"""
+    return lambda match: repl if match.group(0)[0].isupper() else repl[:1].lower() + repl[1:]
+
+# Third-person phrasings rewritten to second person, applied in order; a verb
+# following 'the individual' is conjugated ("the individual takes" -> "you take")
+# and inverted questions keep their tense ("Has the individual been" -> "Have you been")
+_PERSONALIZE_SUBS = tuple((re.compile(pattern, re.IGNORECASE), repl) for pattern, repl in (
+    (r"\bthe individual's\b", 'your'),
+    (r"\bindividual's\b", 'your'),
+    (r'\bthe individual ((?:always|usually|often|ever|never|still|currently) )?([a-z]+s)\b', _second_person),
+    (r'\bthe individual\b', 'you'),
+    (r'\bindividual\b', 'you'),
+    (r'\bDoes you\b', _match_case('Do you')),
+    (r'\bIs you\b', _match_case('Are you')),
+    (r'\bWas you\b', _match_case('Were you')),
+    (r'\bHas you\b', _match_case('Have you')),
+))
+
+# Option layouts per communication style: (option markup, 2 options, 3-4 options,
+# 5+ options header, open text prompt)
+_OPTION_STYLES = {
+    "formal": ("{}", "Please select: {} or {}", "Please choose from: {}", "Please select from the following:\n", "Please provide your response:"),
+    "casual": ("**{}**", "You can answer: {} or {}", "You can choose: {}", "", "💬 Please type your answer"),
+}
+
+def _render_question(question: Question, behavior_mode: str) -> str:
+    """Phrase a question in the user's communication style without a GPT call"""
+    text = question.question_text
+    for pattern, repl in _PERSONALIZE_SUBS:
+        text = pattern.sub(repl, text)
+    text = text[:1].upper() + text[1:]
+    
+    mark, two, few, many, open_text = _OPTION_STYLES.get(behavior_mode, _OPTION_STYLES["casual"])
+    options = [mark.format(opt) for opt in question.field_responses or ()]
+    if not options:
+        prompt = open_text
+    elif len(options) <= 2:
+        prompt = two.format(*options) if len(options) == 2 else few.format(options[0])
+    elif len(options) <= 4:
+        prompt = few.format(f"{', '.join(options[:-1])}, or {options[-1]}")
+    else:
+        prompt = many + "\n".join(f"{i}. {opt}" for i, opt in enumerate(options, 1))
+    return f"{text}\n\n{prompt}"
+
+# Longest a caller waits on another session's identical in-flight call before making its own
+_INFLIGHT_WAIT_SECONDS = 30
+
+# GPT-formatted questions keyed by (question id, text, field type, options, style, model);
+# the formatting is fixed by these, so every session over a template shares it (LRU).
+# A question already being formatted (prewarm, prefetch or on demand) is awaited instead
+_FORMAT_CACHE_SIZE = 2048
+_FORMAT_CACHE: "OrderedDict[Tuple, str]" = OrderedDict()
+_FORMAT_INFLIGHT: Dict[Tuple, Future] = {}
+_FORMAT_LOCK = threading.Lock()
+
+def _claim_format(cache_key: Tuple) -> Tuple[Optional[str], Optional[Future]]:
+    """Cached formatting for a question, or the future to settle if this caller must fetch it"""
+    with _FORMAT_LOCK:
+        cached = _FORMAT_CACHE.get(cache_key)
+        if cached is not None:
+            _FORMAT_CACHE.move_to_end(cache_key)
+            return cached, None
+        pending = _FORMAT_INFLIGHT.get(cache_key)
+        if pending is None:
+            pending = _FORMAT_INFLIGHT[cache_key] = Future()
+            return None, pending
+    # A failed or stalled call elsewhere leaves this caller to format it directly
+    try:
+        return pending.result(timeout=_INFLIGHT_WAIT_SECONDS), None
+    except FutureTimeoutError:
+        return None, None
+
+def _settle_format(cache_key: Tuple, future: Optional[Future], formatted: Optional[str]):
+    """Cache a formatted question and release anyone waiting on it"""
+    with _FORMAT_LOCK:
+        if formatted is not None:
+            _FORMAT_CACHE[cache_key] = formatted
+            if len(_FORMAT_CACHE) > _FORMAT_CACHE_SIZE:
+                _FORMAT_CACHE.popitem(last=False)
+        if future is not None:
+            _FORMAT_INFLIGHT.pop(cache_key, None)
+    if future is not None:
+        future.set_result(formatted)
+
+# Answer analyses keyed by (question id, question text, field type, options, style, model,
+# normalized reply); repeat replies such as "yes" or "skip" skip the API across sessions
+# (LRU). A reply already being analyzed is awaited instead of sent again
+_ANSWER_CACHE_SIZE = 4096
+_ANSWER_CACHE: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_ANSWER_INFLIGHT: Dict[Tuple, Future] = {}
+_ANSWER_LOCK = threading.Lock()
+
+def _claim_analysis(cache_key: Tuple) -> Tuple[Optional[Dict[str, Any]], Optional[Future]]:
+    """Cached analysis for a reply, or the future to settle if this caller must fetch it"""
+    with _ANSWER_LOCK:
+        cached = _ANSWER_CACHE.get(cache_key)
+        if cached is not None:
+            _ANSWER_CACHE.move_to_end(cache_key)
+            return cached, None
+        pending = _ANSWER_INFLIGHT.get(cache_key)
+        if pending is None:
+            pending = _ANSWER_INFLIGHT[cache_key] = Future()
+            return None, pending
+    # Another session is analyzing the same reply; a failed or stalled call leaves this one to retry
+    try:
+        return pending.result(timeout=_INFLIGHT_WAIT_SECONDS), None
+    except FutureTimeoutError:
+        return None, None
+
+def _settle_analysis(cache_key: Tuple, future: Optional[Future], result: Optional[Dict[str, Any]]):
+    """Cache a fetched analysis and release anyone waiting on it"""
+    with _ANSWER_LOCK:
+        if result is not None:
+            _ANSWER_CACHE[cache_key] = result
+            if len(_ANSWER_CACHE) > _ANSWER_CACHE_SIZE:
+                _ANSWER_CACHE.popitem(last=False)
+        if future is not None:
+            _ANSWER_INFLIGHT.pop(cache_key, None)
+    if future is not None:
+        future.set_result(result)
+
+# Bounds the background formatting calls started for a new conversation
+_PREWARM_SLOTS = threading.BoundedSemaphore(10)
+
+# Fixed instructions for the two GPT calls, sent first and unchanged so the API's
+# automatic prefix caching can reuse them; each request then only adds a short JSON
+# payload (q: question, type: field type, opts: options, style, user: reply)
+_FORMAT_SYSTEM_PROMPT = """You rewrite intake form questions in a given communication style. Return ONLY the formatted question, no explanations or meta-commentary.
+
+Input is JSON: q (original question), type (field type), opts (response options; empty means open text), style (formal or casual).
+
+Instructions:
+1. Change "individual" to "you" for personalization
+2. If there are response options, present them clearly
+
+Formal style: formal language and complete sentences, address the user professionally, no emojis or casual expressions, structured and clear, respectful and courteous.
+- 2 options: "Please select: Option1 or Option2"
+- 3-4 options: "Please choose from: A, B, or C"
+- 5+ options: numbered list with "Please select from the following:"
+- Open text: "Please provide your response:"
+
+Casual style: natural and conversational, emojis sparingly (max 1-2), vary your language (avoid phrases like "quick question"), concise but friendly.
+- 2 options: "You can answer: **Option1** or **Option2**"
+- 3-4 options: "You can choose: **A**, **B**, or **C**"
+- 5+ options: numbered list
+- Open text: "💬 Please type your answer\""""
+
+_ANALYZE_SYSTEM_PROMPT = """You are a social services intake assistant. Analyze the user's response to a form question to determine the appropriate action.
+
+Input is JSON: q (question), type (field type), opts (response options; empty means open text), user (the user's input), style (formal or casual).
+
+Communication style:
+- formal: professional language, complete sentences, no emojis, respectful and structured.
+- casual: friendly, conversational tone, emojis OK (sparingly), warm and approachable.
+
+Analysis tasks:
+1. Determine if the user is:
+   a) AVOIDING the question (e.g., "I don't want to answer", "skip this")
+   b) ASKING FOR HELP/EXPLANATION (e.g., "why do you need this?", "what does this mean?")
+   c) PROVIDING AN ANSWER (relevant or irrelevant)
+2. If AVOIDING: Provide gentle persuasion explaining why the info is needed
+3. If ASKING FOR HELP: Explain why this information is important for social services
+4. If ANSWERING: Check if the answer is appropriate for the question
+5. Set should_record only for a valid answer; put any extra guidance in suggestion
+
+Guidelines:
+- Be empathetic and understanding
+- Explain confidentiality when needed
+- For invalid answers, provide examples of good responses
+- For help requests, explain the purpose clearly
+- For avoidance, gently persuade while respecting boundaries
+- Match the requested communication style in response_message"""
+
+# Structured output for the answer analysis: the server guarantees schema-valid JSON
+# with the keys in this order, so the record flags arrive before response_message
+_ANSWER_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "answer_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["avoid", "help", "answer"]},
+                "is_valid_answer": {"type": "boolean"},
+                "should_record": {"type": "boolean"},
+                "response_message": {"type": "string"},
+                "suggestion": {"type": ["string", "null"]}
+            },
+            "required": ["action", "is_valid_answer", "should_record", "response_message", "suggestion"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# A recorded answer needs both flags true; either one false means the reply is guidance
+_JSON_FALSE_FLAG_RE = re.compile(r'"(?:is_valid_answer|should_record)"\s*:\s*false')
+
+def _log_prompt_cache(chunk):
+    """Log how much of the prompt the API served from its prefix cache"""
+    usage = getattr(chunk, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None) if usage else None
+    if details is not None:
+        logger.debug("Prompt tokens: %s, cached: %s", usage.prompt_tokens, details.cached_tokens)
+
+def _stream_text(stream) -> Iterator[str]:
+    """Yield a chat completion stream's text with the outer whitespace trimmed"""
+    started = False
+    pending = ""
+    for chunk in stream:
+        if not chunk.choices:
+            _log_prompt_cache(chunk)
+            continue
+        if not chunk.choices[0].delta.content:
+            continue
+        # Trailing whitespace is held back until more text follows it
+        text = pending + chunk.choices[0].delta.content
+        if not started:
+            text = text.lstrip()
+        body = text.rstrip()
+        pending = text[len(body):]
+        if body:
+            started = True
+            yield body
+
+class _JsonStringField:
+    """Decode one string field of a JSON object incrementally as the object streams in"""
+    
+    def __init__(self, key: str):
+        self._start_re = re.compile(r'"%s"\s*:\s*"' % re.escape(key))
+        self._buffer = ""
+        self._pos = None
+        self.prefix = None  # object text before the field, once it has started
+        self.done = False
+    
+    def feed(self, text: str) -> str:
+        """Add raw JSON text and return the newly decoded part of the field value"""
+        self._buffer += text
+        if self.done:
+            return ""
+        if self._pos is None:
+            match = self._start_re.search(self._buffer)
+            if not match:
+                return ""
+            self.prefix = self._buffer[:match.start()]
+            self._pos = match.end()
+        
+        buffer = self._buffer
+        decoded = []
+        i = self._pos
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self.done = True
+                break
+            if char != '\\':
+                decoded.append(char)
+                i += 1
+                continue
+            # Escapes are decoded whole; a partial one waits for the next chunk
+            end = i + 2
+            if buffer[i + 1:end] == 'u':
+                end = i + 6
+                if buffer[i + 2:i + 4].lower() in ('d8', 'd9', 'da', 'db'):
+                    end = i + 12  # surrogate pair
+            if end > len(buffer):
+                break
+            decoded.append(json.loads(f'"{buffer[i:end]}"'))
+            i = end
+        self._pos = i
+        return "".join(decoded)
+
+@functools.lru_cache(maxsize=32)
+def _shared_client(api_key: str) -> openai.OpenAI:
+    """One OpenAI client per API key, so every engine reuses its pooled connections"""
+    return openai.OpenAI(api_key=api_key, timeout=30)
+
 class ChatbotEngine:
     """AI-powered chatbot for interactive form filling using GPT-4o mini for all intelligence"""
     
     def __init__(self):
         # Lazy load API key when initializing the client
-        api_key = config.get_openai_api_key()
-        openai.api_key = api_key
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = _shared_client(config.get_openai_api_key())
         self.conversation_history = []
         self.current_question = None
         self.current_template = None
         self.responses = {}
         self.personal_info = PersonalInfo()
         self.address_info = AddressInfo()
+        self._keyword_qids = {}
+        self._confirm_idx = 0
+        self._provider_id = None
+        # (response, is_valid, suggestion) of the last stream_answer turn
+        self.last_reply = None
     
     def get_selected_model(self):
         """Get the selected OpenAI model from session state"""
@@ -36,6 +386,21 @@ class ChatbotEngine:
         self.responses = {}
         self.personal_info = PersonalInfo()
         self.address_info = AddressInfo()
+        self._provider_id = template.organization.lower().replace(" ", "_")
+        
+        # Question ids per skip-condition keyword, so skip checks only look at those answers
+        texts = {}
+        for question in template.questions:
+            texts.setdefault(question.id, question.question_text.lower())
+        self._keyword_qids = {keyword: tuple(qid for qid, text in texts.items() if keyword in text)
+                              for _, keyword in _SKIP_CONDITIONS}
+        
+        # Format the rest of the template in the background while the user reads the
+        # welcome and first question; get_next_question then hits the format cache
+        if config.USE_LLM_FORMATTER:
+            import streamlit as st
+            behavior_mode = getattr(st.session_state, 'behavior_mode', 'casual')
+            self._prewarm_questions(template.questions[1:], behavior_mode, self.get_selected_model())
         
         welcome_message = f"""
         Hello! I'm here to help you complete the {template.name} intake form. 
@@ -48,8 +413,39 @@ class ChatbotEngine:
         
         return welcome_message.strip()
     
-    def get_next_question(self) -> Optional[str]:
-        """Get the next question to ask, considering branching logic"""
+    def _prewarm_questions(self, questions: List[Question], behavior_mode: str, model: str):
+        """Format questions into the cache on background threads"""
+        for question in questions:
+            # Daemon threads, so a slow or unreachable API never holds up shutdown
+            threading.Thread(target=self._prewarm_question, args=(question, behavior_mode, model), daemon=True).start()
+    
+    def _prewarm_question(self, question: Question, behavior_mode: str, model: str):
+        """Format and cache one question; failures are left to the on-demand path"""
+        with _PREWARM_SLOTS:
+            for _ in self._stream_format_question(question, behavior_mode, model):
+                pass
+    
+    def _prefetch_next_question(self, behavior_mode: str):
+        """Start formatting the question likely to follow the current one, assuming it gets answered"""
+        for question in self.current_template.questions:
+            if question is self.current_question or question.id in self.responses:
+                continue
+            if self._should_skip_question(question):
+                continue
+            model = self.get_selected_model()
+            
+            def prefetch():
+                for _ in self._stream_format_question(question, behavior_mode, model):
+                    pass
+            
+            threading.Thread(target=prefetch, daemon=True).start()
+            return
+    
+    def get_next_question(self, stream: bool = False) -> Optional[Union[str, Iterator[str]]]:
+        """Get the next question to ask, considering branching logic
+        
+        With stream=True the formatted question comes back as a chunk iterator for st.write_stream
+        """
         if not self.current_template:
             return None
         
@@ -64,181 +460,213 @@ class ChatbotEngine:
                 # Get behavior mode from session state if available
                 import streamlit as st
                 behavior_mode = getattr(st.session_state, 'behavior_mode', 'casual')
-                return self._format_question(question, behavior_mode)
+                return self._format_question(question, behavior_mode, stream)
         
         return None  # All questions answered
     
-    def _format_question(self, question: Question, behavior_mode: str = "casual") -> str:
-        """Format a question for conversational presentation using GPT"""
+    def _format_question(self, question: Question, behavior_mode: str = "casual",
+                         stream: bool = False) -> Union[str, Iterator[str]]:
+        """Format a question for conversational presentation"""
+        if not config.USE_LLM_FORMATTER:
+            formatted = _render_question(question, behavior_mode)
+            return iter((formatted,)) if stream else formatted
+        
+        chunks = self._stream_format_question(question, behavior_mode)
+        return chunks if stream else "".join(chunks)
+    
+    def _stream_format_question(self, question: Question, behavior_mode: str,
+                                model: Optional[str] = None) -> Iterator[str]:
+        """Yield the formatted question as it streams from GPT"""
+        model = model or self.get_selected_model()
+        cache_key = (question.id, question.question_text, question.field_type,
+                     tuple(question.field_responses or ()), behavior_mode, model)
+        formatted, future = _claim_format(cache_key)
+        if formatted is not None:
+            yield formatted
+            return
+        
+        streamed = []
+        formatted = None
         try:
-            if behavior_mode == "formal":
-                style_instructions = """
-                Style: Professional and formal
-                - Use formal language and complete sentences
-                - Address the user professionally 
-                - Avoid emojis and casual expressions
-                - Use structured, clear formatting
-                - Be respectful and courteous
-                """
-                format_examples = """
-                - For 2 options: "Please select: Option1 or Option2"
-                - For 3-4 options: "Please choose from: A, B, or C"  
-                - For 5+ options: numbered list with "Please select from the following:"
-                - For open text: "Please provide your response:"
-                """
-            else:
-                style_instructions = """
-                Style: Casual and friendly
-                - Make it sound natural and conversational
-                - Use emojis sparingly (max 1-2)
-                - Avoid repetitive phrases like "quick question" - vary your language
-                - Keep it concise but friendly
-                """
-                format_examples = """
-                - For 2 options: "You can answer: **Option1** or **Option2**"
-                - For 3-4 options: "You can choose: **A**, **B**, or **C**"  
-                - For 5+ options: numbered list
-                - For open text: "💬 Please type your answer"
-                """
-            
-            prompt = f"""
-            Convert this intake form question into the specified communication style. Only return the final question, no explanations.
-            
-            Original Question: "{question.question_text}"
-            Field Type: {question.field_type}
-            Response Options: {question.field_responses if question.field_responses else "Open text"}
-            
-            {style_instructions}
-            
-            Instructions:
-            1. Change "individual" to "you" for personalization  
-            2. If there are response options, present them clearly
-            3. ONLY return the formatted question, nothing else
-            
-            {format_examples}
-            """
+            payload = {"q": question.question_text, "type": question.field_type,
+                       "opts": question.field_responses or [], "style": behavior_mode}
             
             response = self.client.chat.completions.create(
-                model=self.get_selected_model(),
+                model=model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant. Return ONLY the formatted question, no explanations or meta-commentary."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": _FORMAT_SYSTEM_PROMPT},
+                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
                 ],
-                max_tokens=150,
-                temperature=0.5
+                temperature=0,
+                seed=42,
+                stream=True,
+                stream_options={"include_usage": True}
             )
             
-            return response.choices[0].message.content.strip()
+            for text in _stream_text(response):
+                streamed.append(text)
+                yield text
+            if not streamed:
+                raise ValueError("empty formatted question")
+            formatted = "".join(streamed)
             
         except Exception as e:
-            print(f"Error formatting question: {e}")
-            # Fallback to original question
-            return question.question_text
+            logger.warning("Error formatting question: %s", e)
+            if not streamed:
+                # Fallback to original question
+                yield question.question_text
+        finally:
+            # Also runs when the consumer abandons the stream, so waiters are never stranded
+            _settle_format(cache_key, future, formatted)
     
     def process_answer(self, user_input: str) -> Tuple[str, bool, Optional[str]]:
         """Process user's answer using GPT for all intelligence"""
+        for _ in self.stream_answer(user_input):
+            pass
+        return self.last_reply
+    
+    def stream_answer(self, user_input: str) -> Iterator[str]:
+        """Yield the reply to the user's answer as it streams, for st.write_stream
+        
+        Once the iterator is exhausted, last_reply holds (response, is_valid, suggestion)
+        """
         if not self.current_question:
-            return "I don't have a current question. Let me get the next one for you.", False, None
+            message = "I don't have a current question. Let me get the next one for you."
+            self.last_reply = (message, False, None)
+            yield message
+            return
         
         # Get behavior mode from session state
         import streamlit as st
         behavior_mode = getattr(st.session_state, 'behavior_mode', 'casual')
         
+        # With the GPT formatter, the likely next question is formatted while the answer
+        # is analyzed; get_next_question then joins that call through _claim_format
+        if config.USE_LLM_FORMATTER:
+            self._prefetch_next_question(behavior_mode)
+        
+        question = self.current_question
+        cache_key = (question.id, question.question_text, question.field_type,
+                     tuple(question.field_responses or ()), behavior_mode,
+                     self.get_selected_model(), user_input.strip().lower())
+        result, future = _claim_analysis(cache_key)
+        streamed = ""
+        if result is None:
+            analysis = None
+            try:
+                analysis = yield from self._stream_analysis(user_input, behavior_mode)
+            finally:
+                _settle_analysis(cache_key, future, analysis[0] if analysis else None)
+            if analysis is None:
+                return
+            result, streamed = analysis
+        
+        # If it's a valid answer, record it and move to next question
+        if result.get("should_record", False) and result.get("is_valid_answer", False):
+            self.responses[self.current_question.id] = user_input
+            self._update_standard_fields(self.current_question, user_input)
+            
+            # Generate confirmation and get next question
+            confirmation = self._generate_confirmation(user_input)
+            yield confirmation
+            parts = [confirmation]
+            next_question = self.get_next_question(stream=True)
+            if next_question:
+                parts.append("\n\n")
+                yield "\n\n"
+                for text in next_question:
+                    parts.append(text)
+                    yield text
+            self.last_reply = ("".join(parts), True, None)
+        else:
+            # Return GPT's guidance
+            message = result.get("response_message", "I need a bit more information.")
+            if message.startswith(streamed):
+                if message[len(streamed):]:
+                    yield message[len(streamed):]
+            else:
+                message = streamed
+            self.last_reply = (message, False, result.get("suggestion"))
+    
+    def _stream_analysis(self, user_input: str, behavior_mode: str) -> Iterator[str]:
+        """Run the GPT answer analysis, yielding guidance as it streams
+        
+        Returns (analysis, text already yielded), or None once a fallback reply has been given
+        """
         # Use GPT to analyze the user's input and determine the appropriate response
+        shown = []
         try:
-            question_context = {
-                "question": self.current_question.question_text,
-                "field_type": self.current_question.field_type,
-                "response_options": self.current_question.field_responses,
-                "user_input": user_input,
-                "behavior_mode": behavior_mode
-            }
-            
-            prompt = f"""
-            You are a social services intake assistant. Analyze the user's response to determine the appropriate action.
-            
-            CONTEXT:
-            Question: "{self.current_question.question_text}"
-            Field Type: {self.current_question.field_type}
-            Response Options: {self.current_question.field_responses if self.current_question.field_responses else "Open text"}
-            User's Input: "{user_input}"
-            Communication Style: {behavior_mode.upper()}
-            
-            COMMUNICATION STYLE RULES:
-            {"FORMAL: Use professional language, complete sentences, avoid emojis, be respectful and structured." if behavior_mode == "formal" else "CASUAL: Use friendly, conversational tone, emojis OK (sparingly), be warm and approachable."}
-            
-            ANALYSIS TASKS:
-            1. Determine if the user is:
-               a) AVOIDING the question (e.g., "I don't want to answer", "skip this")
-               b) ASKING FOR HELP/EXPLANATION (e.g., "why do you need this?", "what does this mean?")
-               c) PROVIDING AN ANSWER (relevant or irrelevant)
-            
-            2. If AVOIDING: Provide gentle persuasion explaining why the info is needed
-            3. If ASKING FOR HELP: Explain why this information is important for social services
-            4. If ANSWERING: Check if the answer is appropriate for the question
-            
-            RESPONSE FORMAT - Return ONLY valid JSON:
-            {{
-                "action": "avoid|help|answer",
-                "is_valid_answer": true/false,
-                "response_message": "Your response to the user",
-                "should_record": true/false,
-                "suggestion": "Additional guidance if needed"
-            }}
-            
-            GUIDELINES:
-            - Be empathetic and understanding
-            - Explain confidentiality when needed
-            - For invalid answers, provide examples of good responses
-            - For help requests, explain the purpose clearly
-            - For avoidance, gently persuade while respecting boundaries
-            - MATCH THE COMMUNICATION STYLE ({behavior_mode.upper()}) in your response_message
-            - CRITICAL: Return ONLY valid JSON, no other text
-            """
+            payload = {"q": self.current_question.question_text, "type": self.current_question.field_type,
+                       "opts": self.current_question.field_responses or [], "style": behavior_mode,
+                       "user": user_input}
             
             response = self.client.chat.completions.create(
                 model=self.get_selected_model(),
                 messages=[
-                    {"role": "system", "content": "You are an intelligent social services intake assistant. Always respond with valid JSON."},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": _ANALYZE_SYSTEM_PROMPT},
+                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
                 ],
-                max_tokens=300,
-                temperature=0.7
+                temperature=0.7,
+                response_format=_ANSWER_RESPONSE_FORMAT,
+                stream=True,
+                stream_options={"include_usage": True}
             )
             
+            # Guidance (anything that won't be recorded) is streamed straight out of the
+            # response_message field; a recorded answer shows the confirmation instead
+            raw = []
+            message_field = _JsonStringField("response_message")
+            show_message = None
+            for chunk in response:
+                if not chunk.choices:
+                    _log_prompt_cache(chunk)
+                    continue
+                if not chunk.choices[0].delta.content:
+                    continue
+                raw.append(chunk.choices[0].delta.content)
+                decoded = message_field.feed(raw[-1])
+                if message_field.prefix is None:
+                    continue
+                if show_message is None:
+                    show_message = _JSON_FALSE_FLAG_RE.search(message_field.prefix) is not None
+                if show_message and decoded:
+                    shown.append(decoded)
+                    yield decoded
+            
             # Parse GPT response
-            gpt_response = response.choices[0].message.content.strip()
-            print(f"DEBUG: GPT response: {gpt_response}")
+            gpt_response = "".join(raw).strip()
+            logger.debug("GPT response: %s", gpt_response)
             
             try:
                 result = json.loads(gpt_response)
             except json.JSONDecodeError as e:
-                print(f"JSON parse error: {e}")
-                print(f"Raw response: {gpt_response}")
+                logger.warning("JSON parse error: %s; raw response: %s", e, gpt_response)
+                if shown:
+                    self.last_reply = ("".join(shown), False, None)
+                    return None
                 # Fallback to simple validation
-                return self._simple_fallback_validation(user_input)
+                yield from self._stream_reply(self._simple_fallback_validation(user_input))
+                return None
             
-            # If it's a valid answer, record it and move to next question
-            if result.get("should_record", False) and result.get("is_valid_answer", False):
-                self.responses[self.current_question.id] = user_input
-                self._update_standard_fields(self.current_question, user_input)
-                
-                # Generate confirmation and get next question
-                confirmation = self._generate_confirmation(user_input)
-                next_question = self.get_next_question()
-                
-                if next_question:
-                    return f"{confirmation}\n\n{next_question}", True, None
-                else:
-                    return confirmation, True, None
-            else:
-                # Return GPT's guidance
-                return result.get("response_message", "I need a bit more information."), False, result.get("suggestion")
-                
         except Exception as e:
-            print(f"GPT analysis error: {e}")
+            logger.warning("GPT analysis error: %s", e)
+            if shown:
+                # The stream broke part-way; keep what the user already saw
+                self.last_reply = ("".join(shown), False, None)
+                return None
             # Fallback to simple validation
-            return self._simple_fallback_validation(user_input)
+            yield from self._stream_reply(self._simple_fallback_validation(user_input))
+            return None
+        
+        if not isinstance(result, dict):
+            yield from self._stream_reply(self._simple_fallback_validation(user_input))
+            return None
+        return result, "".join(shown)
+    
+    def _stream_reply(self, reply: Tuple[str, bool, Optional[str]]) -> Iterator[str]:
+        """Yield a reply that was built in one piece, recording it as the last reply"""
+        self.last_reply = reply
+        yield reply[0]
     
     def _simple_fallback_validation(self, user_input: str) -> Tuple[str, bool, Optional[str]]:
         """Simple fallback if GPT fails"""
@@ -282,120 +710,78 @@ class ChatbotEngine:
         if not question.conditional_logic or not self.responses:
             return False
         
-        logic = question.conditional_logic.lower()
-        
         # Simple conditional logic based on previous responses
-        skip_conditions = {
-            "not married": lambda: any("no" in str(resp).lower() for qid, resp in self.responses.items() 
-                                    if "married" in self._get_question_text(qid).lower()),
-            "no court case": lambda: any("no" in str(resp).lower() for qid, resp in self.responses.items() 
-                                       if "court" in self._get_question_text(qid).lower()),
-            "no substance": lambda: any("no" in str(resp).lower() for qid, resp in self.responses.items() 
-                                      if "substance" in self._get_question_text(qid).lower()),
-            "no benefits": lambda: any("no" in str(resp).lower() for qid, resp in self.responses.items() 
-                                     if "benefit" in self._get_question_text(qid).lower())
-        }
-        
-        for condition, check_func in skip_conditions.items():
-            if condition in logic and check_func():
+        for keyword in _skip_keywords(question.conditional_logic):
+            if any("no" in str(self.responses[qid]).lower()
+                   for qid in self._keyword_qids.get(keyword, ()) if qid in self.responses):
                 return True
         
         return False
     
-    def _get_question_text(self, question_id: str) -> str:
-        """Get question text by ID"""
-        for question in self.current_template.questions:
-            if question.id == question_id:
-                return question.question_text
-        return ""
-    
     def _update_standard_fields(self, question: Question, answer: str):
         """Update standard personal/address info based on question content"""
-        question_lower = question.question_text.lower()
-        
-        # Personal info mappings
-        if 'first name' in question_lower:
-            self.personal_info.person_first_name = answer
-        elif 'last name' in question_lower:
-            self.personal_info.person_last_name = answer
-        elif 'email' in question_lower:
-            self.personal_info.person_email_address = answer
-        elif 'phone' in question_lower:
-            self.personal_info.person_phone_number = answer
-        elif 'birth' in question_lower or 'age' in question_lower:
-            self.personal_info.person_date_of_birth = answer
-        elif 'gender' in question_lower:
-            self.personal_info.person_gender = answer
-        elif 'race' in question_lower:
-            self.personal_info.person_race = answer
-        
-        # Address info mappings
-        elif 'address' in question_lower and 'line 1' in question_lower:
-            self.address_info.address_line_1 = answer
-        elif 'city' in question_lower:
-            self.address_info.address_city = answer
-        elif 'state' in question_lower:
-            self.address_info.address_state = answer
-        elif 'zip' in question_lower or 'postal' in question_lower:
-            self.address_info.address_postal_code = answer
+        match = _STANDARD_FIELD_RE.match(question.question_text.lower())
+        if match:
+            field_name = match.lastgroup
+            target = self.address_info if field_name.startswith("address_") else self.personal_info
+            setattr(target, field_name, answer)
     
     def _generate_confirmation(self, answer: str) -> str:
         """Generate a friendly confirmation message"""
-        confirmations = [
-            f"Got it! I've recorded your answer: {answer}",
-            f"Thank you! I've noted: {answer}",
-            f"Perfect! I've saved: {answer}",
-            f"Excellent! I've recorded: {answer}"
-        ]
-        
-        import random
-        return random.choice(confirmations)
+        # Cycle through the phrasings rather than drawing one at random
+        template = _CONFIRMATIONS[self._confirm_idx % len(_CONFIRMATIONS)]
+        self._confirm_idx += 1
+        return template.format(answer=answer)
     
     def generate_summary(self) -> str:
         """Generate a summary of all responses"""
         if not self.current_template:
             return "No form data available."
         
-        summary = f"## Summary of {self.current_template.name}\n\n"
+        parts = [f"## Summary of {self.current_template.name}\n\n"]
         
         # Add personal info
-        if self.personal_info.person_first_name or self.personal_info.person_last_name:
-            summary += "**Personal Information:**\n"
-            if self.personal_info.person_first_name:
-                summary += f"• Name: {self.personal_info.person_first_name}"
-                if self.personal_info.person_last_name:
-                    summary += f" {self.personal_info.person_last_name}"
-                summary += "\n"
-            if self.personal_info.person_email_address:
-                summary += f"• Email: {self.personal_info.person_email_address}\n"
-            if self.personal_info.person_phone_number:
-                summary += f"• Phone: {self.personal_info.person_phone_number}\n"
-            summary += "\n"
+        info = self.personal_info
+        if info.person_first_name or info.person_last_name:
+            parts.append("**Personal Information:**\n")
+            if info.person_first_name:
+                parts.append(f"• Name: {info.person_first_name}")
+                if info.person_last_name:
+                    parts.append(f" {info.person_last_name}")
+                parts.append("\n")
+            if info.person_email_address:
+                parts.append(f"• Email: {info.person_email_address}\n")
+            if info.person_phone_number:
+                parts.append(f"• Phone: {info.person_phone_number}\n")
+            parts.append("\n")
         
         # Add custom responses
         if self.responses:
-            summary += "**Your Responses:**\n"
-            for question in self.current_template.questions:
-                if question.id in self.responses:
-                    summary += f"• {question.question_text}: {self.responses[question.id]}\n"
+            parts.append("**Your Responses:**\n")
+            responses = self.responses
+            parts.extend(f"• {question.question_text}: {responses[question.id]}\n"
+                         for question in self.current_template.questions if question.id in responses)
         
-        return summary
+        return "".join(parts)
     
     def create_assistance_request(self) -> AssistanceRequest:
         """Create an AssistanceRequest object from the collected data"""
         if not self.current_template:
             raise ValueError("No template selected")
         
+        # One clock read, so the ids and both timestamps agree
+        now = datetime.now()
+        stamp = now.strftime('%Y%m%d_%H%M%S')
         return AssistanceRequest(
-            assistance_request_id=f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            assistance_request_id=f"req_{stamp}",
             description=f"Intake form submission for {self.current_template.organization}",
             service_id="intake_001",
-            provider_id=self.current_template.organization.lower().replace(" ", "_"),
-            case_id=f"case_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            provider_id=self._provider_id,
+            case_id=f"case_{stamp}",
             form_id=self.current_template.id,
             personal_info=self.personal_info,
             address_info=self.address_info,
             custom_responses=self.responses,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
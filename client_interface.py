@@ -1,11 +1,15 @@
 import streamlit as st
 from datetime import datetime
+from dataclasses import asdict
 import os
 from data_models import DataManager
 from chatbot_engine_new import ChatbotEngine
 import json
 from auth import is_authenticated, get_user_templates, get_user_info, show_user_header
 
+# Field types rendered with quick-select radio buttons
+_CATEGORICAL_TYPES = frozenset({'dropdown', 'drop down-single select', 'radio', 'single select', 'multi select'})
+
 def get_or_create_chatbot():
     """Get existing chatbot or create new one with current API key"""
     try:
@@ -127,7 +131,7 @@ def show_organization_selection(data_manager, chatbot):
     # Get user's accessible templates
     user_templates = get_user_templates()
     all_templates = data_manager.get_all_templates()
-    accessible_templates = {k: v for k, v in all_templates.items() if k in user_templates}
+    accessible_templates = {k: all_templates[k] for k in user_templates if k in all_templates}
     
     if not accessible_templates:
         user_info = get_user_info()
@@ -189,9 +193,13 @@ def show_chat_interface(chatbot, data_manager):
     if prompt := st.chat_input("Type your answer here..."):
         # Add user message to chat
         st.session_state.messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
         
-        # Process the answer
-        response, is_valid, suggestion = chatbot.process_answer(prompt)
+        # Process the answer, streaming the reply as it arrives
+        with st.chat_message("assistant"):
+            st.write_stream(chatbot.stream_answer(prompt))
+        response, is_valid, suggestion = chatbot.last_reply
         
         # Add assistant response
         st.session_state.messages.append({"role": "assistant", "content": response})
@@ -221,14 +229,12 @@ def show_interactive_input(chatbot):
     if not current_question:
         return
     
-    # Check if this is a categorical question that should have radio buttons
-    categorical_types = ['dropdown', 'drop down-single select', 'radio', 'single select', 'multi select']
-    
     # Debug information
     field_type = current_question.field_type.lower()
     has_responses = current_question.field_responses and len(current_question.field_responses) > 0
     
-    if (has_responses and field_type in categorical_types):
+    # Check if this is a categorical question that should have radio buttons
+    if (has_responses and field_type in _CATEGORICAL_TYPES):
         # Only show radio buttons if there are 5 or fewer options
         if len(current_question.field_responses) <= 5:
             st.markdown("### 🔘 Quick Select Options:")
@@ -427,7 +433,7 @@ def submit_application(chatbot, data_manager):
         
         with col2:
             if os.path.exists(json_file):
-                with open(json_file, 'r') as f:
+                with open(json_file, 'rb') as f:
                     st.download_button(
                         label="📄 Download JSON File",
                         data=f.read(),
@@ -438,7 +444,7 @@ def submit_application(chatbot, data_manager):
         
         with col3:
             if os.path.exists(chat_history_file):
-                with open(chat_history_file, 'r') as f:
+                with open(chat_history_file, 'rb') as f:
                     st.download_button(
                         label="💬 Download Chat History",
                         data=f.read(),
@@ -463,9 +469,6 @@ def submit_application(chatbot, data_manager):
 def save_chat_history(filename, chatbot, assistance_request):
     """Save the complete chat history in JSON format"""
     try:
-        import json
-        from datetime import datetime
-        
         # Create comprehensive chat history
         chat_history = {
             "submission_info": {
@@ -543,14 +546,12 @@ def download_data(chatbot):
         assistance_request = chatbot.create_assistance_request()
         
         # Convert to JSON for download
-        import json
-        from dataclasses import asdict
-        
         data_dict = asdict(assistance_request)
         data_dict['created_at'] = assistance_request.created_at.isoformat()
         data_dict['updated_at'] = assistance_request.updated_at.isoformat()
         
-        json_data = json.dumps(data_dict, indent=2)
+        # Hand Streamlit bytes so it doesn't re-encode the payload
+        json_data = json.dumps(data_dict, indent=2).encode('utf-8')
         
         st.download_button(
             label="📥 Download My Data (JSON)",
@@ -50,6 +50,9 @@ def get_openai_api_key():
 # Don't load API key at import time - only when requested
 # This prevents startup errors when the key isn't available yet
 
+# Phrase questions with GPT instead of the built-in formatter (opt-in)
+USE_LLM_FORMATTER = os.getenv("USE_LLM_FORMATTER", "").lower() in ("1", "true", "yes")
+
 # File paths
 SAMPLE_DATA_DIR = "Sample Data"
 OUTPUT_DIR = "output"
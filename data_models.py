@@ -5,8 +5,9 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 import os
+import threading
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """Represents a single question in the intake form"""
     id: str
@@ -34,7 +35,7 @@ class FormTemplate:
     base_template_id: Optional[str] = None
     is_active: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class PersonalInfo:
     """Standard personal information fields"""
     person_first_name: Optional[str] = None
@@ -50,7 +51,7 @@ class PersonalInfo:
     person_phone_number: Optional[str] = None
     person_email_address: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AddressInfo:
     """Address information fields"""
     address_type: Optional[str] = None
@@ -61,7 +62,7 @@ class AddressInfo:
     address_country: Optional[str] = None
     address_postal_code: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AssistanceRequest:
     """Complete assistance request submission"""
     assistance_request_id: str
@@ -76,12 +77,24 @@ class AssistanceRequest:
     created_at: datetime
     updated_at: datetime
 
+SUBMISSIONS_FILE = "submissions/submitted_applications.json"
+
 class DataManager:
     """Manages data operations for the intake system"""
     
     def __init__(self, sample_data_dir: str = "Sample Data"):
         self.sample_data_dir = sample_data_dir
         self.templates = {}
+        # Sorted version lists per organization, dropped whenever templates change
+        self._versions_cache: Dict[str, List[FormTemplate]] = {}
+        # Secondary index by template id, rebuilt whenever self.templates changes
+        self._by_id: Dict[str, FormTemplate] = {}
+        # Active version id per base template id, rebuilt alongside _by_id
+        self._active_by_base: Dict[str, str] = {}
+        # Bumped whenever self.templates changes; used as a cache key by the UI
+        self.revision = 0
+        # One instance is shared by every Streamlit session; guards the templates and their indexes
+        self._lock = threading.Lock()
         self.load_templates_from_excel()
     
     def load_templates_from_excel(self):
@@ -93,11 +106,16 @@ class DataManager:
             "sbnj_mobile": "SBNJ Mobile Midwife Clinic ARF - NO PII.xlsx"
         }
         
+        loaded = {}
         for org_key, filename in excel_files.items():
             file_path = os.path.join(self.sample_data_dir, filename)
             if os.path.exists(file_path):
-                template = self._create_template_from_excel(file_path, org_key)
-                self.templates[org_key] = template
+                loaded[org_key] = self._create_template_from_excel(file_path, org_key)
+        
+        with self._lock:
+            self.templates.update(loaded)
+            self._versions_cache.clear()
+            self._reindex()
     
     def _create_template_from_excel(self, file_path: str, org_key: str) -> FormTemplate:
         """Create a form template from Excel file"""
@@ -227,82 +245,105 @@ class DataManager:
             updated_at=datetime.now()
         )
     
+    def _reindex(self):
+        """Rebuild the id -> template and base id -> active version indexes and bump the revision (under self._lock)"""
+        self._by_id = {t.id: t for t in self.templates.values()}
+        self._active_by_base = {}
+        for t in self.templates.values():
+            if t.is_active:
+                base_id = t.base_template_id or t.id
+                current = self._by_id.get(self._active_by_base.get(base_id))
+                if current is None or t.version > current.version:
+                    self._active_by_base[base_id] = t.id
+        self.revision += 1
+    
+    def get_template_by_id(self, template_id: str) -> Optional[FormTemplate]:
+        """Get template by its ID"""
+        return self._by_id.get(template_id)
+    
+    def get_active(self, base_id: str) -> Optional[str]:
+        """Get the id of the active version of a base template"""
+        return self._active_by_base.get(base_id)
+    
     def get_template(self, org_key: str) -> Optional[FormTemplate]:
         """Get template by organization key"""
         return self.templates.get(org_key)
     
     def get_all_templates(self) -> Dict[str, FormTemplate]:
         """Get all available templates"""
-        return self.templates
+        with self._lock:
+            return dict(self.templates)
     
     def save_template(self, template: FormTemplate):
         """Save a template with versioning"""
         org_key = template.organization.lower().replace(" ", "_")
-        
-        # If this is an update to existing template, create new version
-        if org_key in self.templates and template.base_template_id:
-            # Deactivate the old version
-            old_template = self.templates[org_key]
-            old_template.is_active = False
-            
-            # Find the highest version number for this organization
-            max_version = 1
-            for key, tmpl in self.templates.items():
-                if (tmpl.organization == template.organization and 
-                    (tmpl.base_template_id == template.base_template_id or tmpl.id == template.base_template_id)):
-                    max_version = max(max_version, tmpl.version)
-            
-            # Set version number for new template
-            template.version = max_version + 1
-            
-            # Create unique key with version
-            versioned_key = f"{org_key}_v{template.version}"
-            self.templates[versioned_key] = template
-            
-            # Keep the original key pointing to latest active version
-            self.templates[org_key] = template
-        else:
-            # New template
-            template.version = 1
-            template.is_active = True
-            self.templates[org_key] = template
+        with self._lock:
+            self._versions_cache.clear()
+            
+            # If this is an update to existing template, create new version
+            if org_key in self.templates and template.base_template_id:
+                # Deactivate the old version
+                old_template = self.templates[org_key]
+                old_template.is_active = False
+                
+                # Find the highest version number for this organization
+                max_version = 1
+                for key, tmpl in self.templates.items():
+                    if (tmpl.organization == template.organization and 
+                        (tmpl.base_template_id == template.base_template_id or tmpl.id == template.base_template_id)):
+                        max_version = max(max_version, tmpl.version)
+                
+                # Set version number for new template
+                template.version = max_version + 1
+                
+                # Create unique key with version
+                versioned_key = f"{org_key}_v{template.version}"
+                self.templates[versioned_key] = template
+                
+                # Keep the original key pointing to latest active version
+                self.templates[org_key] = template
+            else:
+                # New template
+                template.version = 1
+                template.is_active = True
+                self.templates[org_key] = template
+            
+            self._reindex()
     
     def get_template_versions(self, organization: str) -> List[FormTemplate]:
         """Get all versions of templates for an organization"""
-        org_key = organization.lower().replace(" ", "_")
-        versions = []
-        
-        for key, template in self.templates.items():
-            if template.organization == organization:
-                versions.append(template)
-        
-        # Sort by version number, newest first
-        return sorted(versions, key=lambda x: x.version, reverse=True)
+        with self._lock:
+            versions = self._versions_cache.get(organization)
+            if versions is None:
+                versions = [t for t in self.templates.values() if t.organization == organization]
+                
+                # Sort by version number, newest first
+                versions.sort(key=lambda x: x.version, reverse=True)
+                self._versions_cache[organization] = versions
+        # A copy, so callers cannot reorder or extend the cached list
+        return list(versions)
     
     def set_active_template(self, template_id: str):
         """Set a specific template version as active"""
-        target_template = None
-        
-        # Find the template by ID
-        for template in self.templates.values():
-            if template.id == template_id:
-                target_template = template
-                break
-        
-        if not target_template:
-            return False
-        
-        # Deactivate all versions for this organization
-        for template in self.templates.values():
-            if template.organization == target_template.organization:
-                template.is_active = False
-        
-        # Activate the selected version
-        target_template.is_active = True
-        
-        # Update the main organization key to point to active version
-        org_key = target_template.organization.lower().replace(" ", "_")
-        self.templates[org_key] = target_template
+        with self._lock:
+            target_template = self._by_id.get(template_id)
+            
+            if not target_template:
+                return False
+            
+            # Deactivate all versions for this organization
+            for template in self.templates.values():
+                if template.organization == target_template.organization:
+                    template.is_active = False
+            
+            # Activate the selected version
+            target_template.is_active = True
+            self._versions_cache.clear()
+            
+            # Update the main organization key to point to active version
+            org_key = target_template.organization.lower().replace(" ", "_")
+            self.templates[org_key] = target_template
+            self._reindex()
         
         return True
     
@@ -382,7 +423,7 @@ class DataManager:
             os.makedirs(submissions_dir, exist_ok=True)
             
             # Load existing submissions or create new list
-            submissions_file = f"{submissions_dir}/submitted_applications.json"
+            submissions_file = SUBMISSIONS_FILE
             submitted_applications = []
             
             if os.path.exists(submissions_file):
@@ -410,15 +451,20 @@ class DataManager:
         except Exception as e:
             print(f"Error saving submitted application: {e}")
     
+    def get_submissions_mtime(self) -> float:
+        """Modification time of the submissions file (0.0 if nothing submitted yet)"""
+        try:
+            return os.path.getmtime(SUBMISSIONS_FILE)
+        except OSError:
+            return 0.0
+    
     def get_submitted_applications(self, organization_filter: Optional[str] = None) -> List[Dict]:
         """Get submitted applications, optionally filtered by organization"""
         try:
-            submissions_file = "submissions/submitted_applications.json"
-            
-            if not os.path.exists(submissions_file):
+            if not os.path.exists(SUBMISSIONS_FILE):
                 return []
             
-            with open(submissions_file, 'r') as f:
+            with open(SUBMISSIONS_FILE, 'r') as f:
                 applications = json.load(f)
             
             # Filter by organization if specified
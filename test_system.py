@@ -7,6 +7,13 @@ import os
 import sys
 from datetime import datetime
 
+def _offline_engine(module):
+    """Build a chatbot engine that never reaches the OpenAI API; GPT calls fall back locally"""
+    os.environ.setdefault("OPENAI_API_KEY", "test-key")
+    chatbot = module.ChatbotEngine()
+    chatbot.client = None
+    return chatbot
+
 def test_imports():
     """Test that all required modules can be imported"""
     print("Testing imports...")
@@ -109,6 +116,152 @@ def test_chatbot_engine():
         print(f"❌ Chatbot engine error: {e}")
         return False
 
+def test_question_personalization():
+    """Test that third-person questions are rewritten as grammatical second person"""
+    print("\nTesting question personalization...")
+    from data_models import Question
+    from chatbot_engine_new import _render_question
+    
+    cases = {
+        "Has the individual been arrested?": "Have you been arrested?",
+        "Please list any medication the individual takes": "Please list any medication you take",
+        "Does the individual have insurance?": "Do you have insurance?",
+        "Is the individual a veteran?": "Are you a veteran?",
+        "Where does the individual live?": "Where do you live?",
+        "What is the individual's date of birth?": "What is your date of birth?",
+        "How often the individual misses meals": "How often you miss meals",
+    }
+    for text, expected in cases.items():
+        question = Question(id="q", number=1, question_text=text, field_type="text", field_responses=[])
+        rendered = _render_question(question, "formal").split("\n\n")[0]
+        assert rendered == expected, f"{text!r} -> {rendered!r}, expected {expected!r}"
+    print(f"✅ {len(cases)} questions personalized correctly")
+    
+    return True
+
+def test_validation_cache():
+    """Test that a repeated free-text answer reuses the cached GPT verdict"""
+    print("\nTesting validation cache...")
+    import chatbot_engine
+    from data_models import Question
+    
+    chatbot = _offline_engine(chatbot_engine)
+    question = Question(id="validation-cache-test", number=1, question_text="Describe your current job",
+                        field_type="text", field_responses=[])
+    chatbot_engine._VALIDATION_CACHE[(question.id, "i live in broomfield")] = (False, "That is a city, not a job.")
+    
+    # Case and spacing are normalized away, so no API call is needed
+    assert chatbot._validate_descriptive_answer("  I live in Broomfield ", question) == (False, "That is a city, not a job.")
+    # Without a cached verdict the failed call accepts the answer and caches nothing
+    assert chatbot._validate_descriptive_answer("I work nights at the hospital", question) == (True, None)
+    assert (question.id, "i work nights at the hospital") not in chatbot_engine._VALIDATION_CACHE
+    print("✅ Cached verdict reused")
+    
+    return True
+
+def test_skip_rules():
+    """Test that the answer indices drive the legacy engine's skip rules"""
+    print("\nTesting skip rules...")
+    import chatbot_engine
+    from data_models import Question, FormTemplate
+    
+    texts = ["Do you have an open court case?", "What is the referral source for the court?", "Are you married?",
+             "What is your spouse's name?", "Which program are you enrolled in?", "Are you in the DADS program?",
+             "Do you receive benefits?", "What is the monthly benefit amount?", "Secondary contact name",
+             "How long have you been married?"]
+    questions = [Question(id=f"skip-q{i}", number=i, question_text=text, field_type="text", field_responses=[])
+                 for i, text in enumerate(texts, 1)]
+    questions[-1].conditional_logic = "If Q3 = 'Yes', show this question"
+    template = FormTemplate(id="skip-test", name="Skip Test", organization="Test Organization", description="",
+                            questions=questions, standard_fields=[], created_at=datetime.now(), updated_at=datetime.now())
+    
+    chatbot = _offline_engine(chatbot_engine)
+    chatbot.start_conversation(template)
+    court, referral, married, spouse, enrolled, dads, benefits, amount, secondary, how_long = questions
+    assert not any(chatbot._should_skip_question(q) for q in (referral, spouse, dads, amount, secondary))
+    assert chatbot._should_skip_question(how_long)  # "show if" waits for Q3
+    
+    for question, answer in ((court, "No"), (married, " Single"), (enrolled, "EPIC and MEND"), (benefits, "none")):
+        chatbot._record_answer(question, answer)
+    assert all(chatbot._should_skip_question(q) for q in (referral, spouse, dads, amount, how_long, secondary))
+    
+    # Re-answering updates the indices rather than adding to them
+    chatbot._record_answer(married, "Yes")
+    chatbot._record_answer(enrolled, "DADS")
+    assert not chatbot._should_skip_question(spouse)
+    assert not chatbot._should_skip_question(how_long)
+    assert not chatbot._should_skip_question(dads)
+    print("✅ Skip rules followed the recorded answers")
+    
+    return True
+
+def test_keyword_skip_conditions():
+    """Test that the GPT engine skips questions whose skip condition matches an answer"""
+    print("\nTesting keyword skip conditions...")
+    import chatbot_engine_new
+    from data_models import Question, FormTemplate
+    
+    questions = [
+        Question(id="kw-married", number=1, question_text="Are you married?", field_type="text", field_responses=[]),
+        Question(id="kw-court", number=2, question_text="Any court dates coming up?", field_type="text", field_responses=[]),
+        Question(id="kw-spouse", number=3, question_text="Spouse's name", field_type="text", field_responses=[],
+                 conditional_logic="Skip if not married"),
+        Question(id="kw-lawyer", number=4, question_text="Lawyer's name", field_type="text", field_responses=[],
+                 conditional_logic="Skip if no court case"),
+        Question(id="kw-amount", number=5, question_text="Monthly amount", field_type="text", field_responses=[],
+                 conditional_logic="Skip if no benefits"),
+    ]
+    template = FormTemplate(id="kw-test", name="Keyword Test", organization="Test Organization", description="",
+                            questions=questions, standard_fields=[], created_at=datetime.now(), updated_at=datetime.now())
+    
+    chatbot = _offline_engine(chatbot_engine_new)
+    chatbot.start_conversation(template)
+    married, court, spouse, lawyer, amount = questions
+    assert not chatbot._should_skip_question(spouse)
+    
+    chatbot.responses[married.id] = "No, single"
+    chatbot.responses[court.id] = "Yes, next month"
+    assert chatbot._should_skip_question(spouse)
+    assert not chatbot._should_skip_question(lawyer)
+    # No question mentions benefits, so that condition never applies
+    assert not chatbot._should_skip_question(amount)
+    print("✅ Skip conditions followed the matching answers")
+    
+    return True
+
+def test_standard_field_mapping():
+    """Test that question wording maps answers onto the right standard fields"""
+    print("\nTesting standard field mapping...")
+    import chatbot_engine_new
+    from data_models import Question, PersonalInfo, AddressInfo
+    
+    # The first matching rule wins, in the order first name ... race, then address fields
+    cases = {
+        "Individual's first name": "person_first_name",
+        "Email or phone number": "person_email_address",
+        "What is your age?": "person_date_of_birth",
+        "State of birth": "person_date_of_birth",
+        "Address line 1": "address_line_1",
+        "Line 1 of your address": "address_line_1",
+        "Address line 2": None,
+        "City": "address_city",
+        "Postal code": "address_postal_code",
+        "Emergency contact": None,
+    }
+    chatbot = _offline_engine(chatbot_engine_new)
+    for text, expected in cases.items():
+        chatbot.personal_info, chatbot.address_info = PersonalInfo(), AddressInfo()
+        question = Question(id="field-q", number=1, question_text=text, field_type="text", field_responses=[])
+        chatbot._update_standard_fields(question, "answer")
+        target = chatbot.address_info if expected and expected.startswith("address_") else chatbot.personal_info
+        filled = [name for info in (chatbot.personal_info, chatbot.address_info)
+                  for name in type(info).__dataclass_fields__ if getattr(info, name) is not None]
+        assert filled == ([expected] if expected else []), f"{text!r} filled {filled}"
+        assert expected is None or getattr(target, expected) == "answer"
+    print(f"✅ {len(cases)} questions mapped correctly")
+    
+    return True
+
 def test_openai_connection():
     """Test OpenAI API connection"""
     print("\nTesting OpenAI connection...")
@@ -167,6 +320,11 @@ def main():
         test_file_operations,
         test_data_loading,
         test_chatbot_engine,
+        test_question_personalization,
+        test_validation_cache,
+        test_skip_rules,
+        test_keyword_skip_conditions,
+        test_standard_field_mapping,
         test_openai_connection
     ]
     